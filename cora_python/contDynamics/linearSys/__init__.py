@@ -15,6 +15,7 @@ from .simulate import simulate
 from .reach import reach
 from .canonicalForm import canonicalForm
 from .oneStep import oneStep
+from .simulateBatch import simulateBatch
 from cora_python.g.classes.taylorLinSys import TaylorLinSys
 from .private.priv_reach_standard import priv_reach_standard
 from .private.priv_reach_wrappingfree import priv_reach_wrappingfree
@@ -34,6 +35,7 @@ LinearSys.ne = ne
 LinearSys.isequal = isequal
 LinearSys.simulate = simulate
 LinearSys.simulateRandom = simulateRandom
+LinearSys.simulateBatch = simulateBatch
 LinearSys.reach = reach
 LinearSys.canonicalForm = canonicalForm
 LinearSys.oneStep = oneStep
@@ -47,5 +49,5 @@ LinearSys.generateRandom = staticmethod(generateRandom)
 LinearSys.taylorLinSys = lambda self, options=None: TaylorLinSys(self.A)
 
 __all__ = ['LinearSys', 'display', 'eq', 'isequal', 'ne', 'generateRandom', 'simulate', 
-           'simulateRandom', 'reach', 'canonicalForm', 'oneStep', 'TaylorLinSys', 'priv_reach_standard', 
+           'simulateRandom', 'simulateBatch', 'reach', 'canonicalForm', 'oneStep', 'TaylorLinSys', 'priv_reach_standard', 
            'priv_reach_wrappingfree', 'priv_outputSet_canonicalForm', 'homogeneousSolution', 'affineSolution'] 
\ No newline at end of file
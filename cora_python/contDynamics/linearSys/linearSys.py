@@ -14,6 +14,51 @@ from typing import Optional, Union, Tuple, Any
 import numpy as np
 import warnings
 from ..contDynamics import ContDynamics
+from cora_python.g.classes.taylorLinSys import TaylorLinSys
+
+
+# Order of the system matrices in the positional constructor syntax
+_SLOT_NAMES = ('A', 'B', 'c', 'C', 'D', 'k', 'E', 'F')
+
+# shared placeholder for unset matrices of empty systems (read-only, never
+# written to, so all instances can reference the same object)
+_EMPTY_2D = np.array([[]])
+_EMPTY_2D.flags.writeable = False
+
+# Error messages of the ndim checks, in the order B, C, D, E, F and c, k
+_MATRIX_NDIM_MSGS = ("Input matrix B must be 1D or 2D",
+                     "Output matrix C must be 1D or 2D",
+                     "Feedthrough matrix D must be 1D or 2D",
+                     "Disturbance matrix E must be 1D or 2D",
+                     "Noise matrix F must be 1D or 2D")
+_VECTOR_NDIM_MSGS = ("Offset c must be a vector",
+                     "Offset k must be a vector")
+
+
+def _to_f64(x):
+    """Convert a system matrix to a float64 array (None is kept)"""
+    # np.asarray keeps scalars 0-dimensional (np.ascontiguousarray would promote
+    # them to 1D), which the scalar B/E/F handling below relies on; the memory
+    # layout is fixed once at the end of _compute_properties
+    return None if x is None else np.asarray(x, dtype=np.float64)
+
+
+def _canon_vec(v):
+    """Column-vector view of an (already converted) offset vector c or k"""
+    # scalar and 1D offsets become n x 1; reshape returns a view, not a copy
+    return v.reshape(-1, 1) if v.ndim < 2 else v
+
+
+def _check_rows(M, n: int, msg: str):
+    """Raise if matrix M has not n rows (a 1D array counts as a column)"""
+    if M is not None and M.ndim > 0 and M.shape[0] != n:
+        raise ValueError(msg)
+
+
+def _check_cols(M, n: int, msg: str):
+    """Raise if matrix M has not n columns (a 1D array counts as a row)"""
+    if M is not None and M.ndim > 0 and M.shape[-1] != n:
+        raise ValueError(msg)
 
 
 class LinearSys(ContDynamics):
@@ -42,6 +87,10 @@ class LinearSys(ContDynamics):
         F (np.ndarray): Noise matrix (q x s)
         taylor (dict): Struct storing values from Taylor expansion
         krylov (dict): Struct storing values for Krylov subspace
+    
+    Note:
+        The matrices A, B, C, D, E, F are stored in Fortran (column-major)
+        order as expected by LAPACK, e.g., scipy.linalg.expm in TaylorLinSys.
     """
     
     def __init__(self, *args, **kwargs):
@@ -110,44 +159,30 @@ class LinearSys(ContDynamics):
         
         # Default values
         def_name = 'linearSys'
-        A = B = c = C = D = k = E = F = None
-        
-        # First handle positional arguments
-        if len(args) > 0:
-            # Check if first argument is name (string)
-            if isinstance(args[0], str):
-                # First argument is name
-                name = args[0]
-                remaining_args = args[1:]
-            else:
-                # No name provided, use default
-                name = def_name
-                remaining_args = args
-            
-            # Assign remaining arguments to matrices
-            matrices = [A, B, c, C, D, k, E, F]
-            for i, arg in enumerate(remaining_args):
-                if i < len(matrices):
-                    matrices[i] = arg
-            A, B, c, C, D, k, E, F = matrices
+        
+        # First handle positional arguments (optional leading name)
+        if args and isinstance(args[0], str):
+            name = args[0]
+            remaining_args = args[1:]
         else:
             name = def_name
+            remaining_args = args
+        
+        # Assign remaining arguments to matrices in slot order, missing ones
+        # default to None and surplus arguments are ignored
+        matrices = dict.fromkeys(_SLOT_NAMES)
+        matrices.update(zip(_SLOT_NAMES, remaining_args))
         
         # Then handle keyword arguments (override positional args if provided)
         if kwargs:
             name = kwargs.get('name', name)
-            A = kwargs.get('A', A)
-            B = kwargs.get('B', B)
-            c = kwargs.get('c', c)
             # Support both 'C' and 'output_matrix' keywords
-            if 'C' in kwargs:
-                C = kwargs['C']
-            elif 'output_matrix' in kwargs:
-                C = kwargs['output_matrix']
-            D = kwargs.get('D', D)
-            k = kwargs.get('k', k)
-            E = kwargs.get('E', E)
-            F = kwargs.get('F', F)
+            if 'C' not in kwargs and 'output_matrix' in kwargs:
+                matrices['C'] = kwargs['output_matrix']
+            matrices.update((slot, kwargs[slot]) for slot in _SLOT_NAMES if slot in kwargs)
+        
+        # Convert all matrices once; checks and property computation reuse them
+        A, B, c, C, D, k, E, F = (_to_f64(matrices[slot]) for slot in _SLOT_NAMES)
         
         return name, A, B, c, C, D, k, E, F
     
@@ -163,45 +198,17 @@ class LinearSys(ContDynamics):
         
         # Check A matrix
         if A is not None:
-            A = np.asarray(A)
             if A.ndim != 2 or A.shape[0] != A.shape[1]:
                 raise ValueError("State matrix A must be square")
         
-        # Check other matrices if provided
-        if B is not None:
-            B = np.asarray(B)
-            if B.ndim > 2:
-                raise ValueError("Input matrix B must be 1D or 2D")
-        
-        if c is not None:
-            c = np.asarray(c)
-            if c.ndim > 1 and c.shape[1] != 1:
-                raise ValueError("Offset c must be a vector")
-        
-        if C is not None:
-            C = np.asarray(C)
-            if C.ndim > 2:
-                raise ValueError("Output matrix C must be 1D or 2D")
-        
-        if D is not None:
-            D = np.asarray(D)
-            if D.ndim > 2:
-                raise ValueError("Feedthrough matrix D must be 1D or 2D")
-        
-        if k is not None:
-            k = np.asarray(k)
-            if k.ndim > 1 and k.shape[1] != 1:
-                raise ValueError("Offset k must be a vector")
-        
-        if E is not None:
-            E = np.asarray(E)
-            if E.ndim > 2:
-                raise ValueError("Disturbance matrix E must be 1D or 2D")
-        
-        if F is not None:
-            F = np.asarray(F)
-            if F.ndim > 2:
-                raise ValueError("Noise matrix F must be 1D or 2D")
+        # Check other matrices if provided (shape checks only, no copies)
+        for M, msg in zip((B, C, D, E, F), _MATRIX_NDIM_MSGS):
+            if M is not None and M.ndim > 2:
+                raise ValueError(msg)
+        
+        for v, msg in zip((c, k), _VECTOR_NDIM_MSGS):
+            if v is not None and v.ndim > 1 and v.shape[1] != 1:
+                raise ValueError(msg)
         
         # Check dimensional consistency if A is provided
         if A is not None:
@@ -209,39 +216,13 @@ class LinearSys(ContDynamics):
             
             # Check c dimensions
             if c is not None:
-                c = np.asarray(c)
                 if c.size != states:
                     raise ValueError("Length of offset c must match dimension of state matrix A")
             
-            # Check B dimensions
-            if B is not None:
-                B = np.asarray(B)
-                if B.ndim == 1:
-                    if B.size != states:
-                        raise ValueError("Input matrix B must have same number of rows as A")
-                elif B.ndim == 2:
-                    if B.shape[0] != states:
-                        raise ValueError("Input matrix B must have same number of rows as A")
-            
-            # Check E dimensions
-            if E is not None:
-                E = np.asarray(E)
-                if E.ndim == 1:
-                    if E.size != states:
-                        raise ValueError("Disturbance matrix E must have same number of rows as A")
-                elif E.ndim == 2:
-                    if E.shape[0] != states:
-                        raise ValueError("Disturbance matrix E must have same number of rows as A")
-            
-            # Check C dimensions
-            if C is not None:
-                C = np.asarray(C)
-                if C.ndim == 1:
-                    if C.size != states:
-                        raise ValueError("Output matrix C must have same number of columns as A")
-                elif C.ndim == 2:
-                    if C.shape[1] != states:
-                        raise ValueError("Output matrix C must have same number of columns as A")
+            # Check B, E, and C dimensions (scalars are expanded later)
+            _check_rows(B, states, "Input matrix B must have same number of rows as A")
+            _check_rows(E, states, "Disturbance matrix E must have same number of rows as A")
+            _check_cols(C, states, "Output matrix C must have same number of columns as A")
     
     def _compute_properties(self, name: str, A, B, c, C, D, k, E, F) -> Tuple:
         """
@@ -250,17 +231,15 @@ class LinearSys(ContDynamics):
         
         # Handle empty case
         if A is None:
-            A = np.array([[]])
+            A = _EMPTY_2D
             states = 0
         else:
-            A = np.asarray(A, dtype=float)
             states = A.shape[0]
         
         # Input matrix and number of inputs
         if A.size > 0 and B is None:
             B = np.zeros((states, 1))
         elif B is not None:
-            B = np.asarray(B, dtype=float)
             if B.ndim == 1:
                 B = B.reshape(-1, 1)
         
@@ -278,27 +257,23 @@ class LinearSys(ContDynamics):
         
         # Constant offset
         if c is None:
-            c = np.zeros((states, 1)) if states > 0 else np.array([[]])
+            c = np.zeros((states, 1)) if states > 0 else _EMPTY_2D
         else:
-            c = np.asarray(c, dtype=float)
-            if c.ndim == 1:
-                c = c.reshape(-1, 1)
+            c = _canon_vec(c)
         
         # Output matrix and number of outputs
         if C is None:
-            C = np.eye(states) if states > 0 else np.array([[]])
+            C = np.eye(states) if states > 0 else _EMPTY_2D
             outputs = states
         else:
-            C = np.asarray(C, dtype=float)
             if C.ndim == 1:
                 C = C.reshape(1, -1)
             outputs = C.shape[0]
         
         # Feedthrough matrix
         if D is None:
-            D = np.zeros((outputs, inputs)) if outputs > 0 and inputs > 0 else np.array([[]])
+            D = np.zeros((outputs, inputs)) if outputs > 0 and inputs > 0 else _EMPTY_2D
         else:
-            D = np.asarray(D, dtype=float)
             if D.ndim == 1:
                 D = D.reshape(1, -1)
             # Handle scalar D
@@ -307,24 +282,21 @@ class LinearSys(ContDynamics):
         
         # Output offset
         if k is None:
-            k = np.zeros((outputs, 1)) if outputs > 0 else np.array([[]])
+            k = np.zeros((outputs, 1)) if outputs > 0 else _EMPTY_2D
         else:
-            k = np.asarray(k, dtype=float)
-            if k.ndim == 1:
-                k = k.reshape(-1, 1)
+            k = _canon_vec(k)
         
         # Disturbance matrix and number of disturbances
         if E is None:
-            E = np.zeros((states, 1)) if states > 0 else np.array([[]])
+            E = np.zeros((states, 1)) if states > 0 else _EMPTY_2D
             dists = 1 if states > 0 else 0
         else:
-            E = np.asarray(E, dtype=float)
             if np.isscalar(E) or (E.ndim == 0):
                 # Scalar E means dists = states (MATLAB behavior)
                 dists = states
                 # Convert scalar E to proper matrix: E * I (identity matrix)
                 scalar_e = float(E)
-                E = scalar_e * np.eye(states) if states > 0 else np.array([[]])
+                E = scalar_e * np.eye(states) if states > 0 else _EMPTY_2D
             elif E.ndim == 1:
                 E = E.reshape(-1, 1)
                 dists = 1
@@ -333,36 +305,34 @@ class LinearSys(ContDynamics):
         
         # Noise matrix and number of noises
         if F is None:
-            F = np.zeros((outputs, 1)) if outputs > 0 else np.array([[]])
+            F = np.zeros((outputs, 1)) if outputs > 0 else _EMPTY_2D
             noises = 1 if outputs > 0 else 0  # MATLAB behavior: when F is empty, noises = F.shape[1] = 1
         else:
-            F = np.asarray(F, dtype=float)
             if np.isscalar(F) or (F.ndim == 0):
                 # Scalar F means noises = outputs (MATLAB behavior)
                 noises = outputs
                 # Convert scalar F to proper matrix: F * I (identity matrix)
                 scalar_f = float(F)
-                F = scalar_f * np.eye(outputs) if outputs > 0 else np.array([[]])
+                F = scalar_f * np.eye(outputs) if outputs > 0 else _EMPTY_2D
             elif F.ndim == 1:
                 F = F.reshape(-1, 1)
                 noises = 1
             else:
                 noises = F.shape[1]
         
+        # Store matrices column-major so LAPACK-backed routines (expm, solve)
+        # do not copy them on every call
+        A, B, C, D, E, F = (M if M is None else np.asfortranarray(M)
+                            for M in (A, B, C, D, E, F))
+        
         return name, A, B, c, C, D, k, E, F, states, inputs, outputs, dists, noises
     
-    def get_taylor(self, name: str, *args):
+    def get_taylor(self, name: str, *args, **kwargs):
         """
         Wrapper function to read out auxiliary values stored in sys.taylor
-        If the requested value is not there, we compute it
+        If the requested value is not there, we compute it (see getTaylor)
         """
-        # This is a placeholder - actual implementation would depend on 
-        # the taylorLinSys class which handles Taylor expansion computations
-        if name not in self.taylor:
-            # Compute and store the value
-            # This would call appropriate computation functions
-            pass
-        return self.taylor.get(name, None)
+        return self.getTaylor(name, *args, **kwargs)
     
     def getTaylor(self, name: str, *args, **kwargs):
         """
@@ -371,8 +341,6 @@ class LinearSys(ContDynamics):
         
         This method matches the MATLAB interface exactly.
         """
-        from cora_python.g.classes.taylorLinSys import TaylorLinSys
-        
         # Initialize taylor if not present (match MATLAB behavior)
         if self.taylor is None:
             self.taylor = TaylorLinSys(self.A)
@@ -12,6 +12,7 @@ Date: 8.6.2025
 from typing import Optional, Tuple, Dict, Any, Union
 import numpy as np
 from scipy.integrate import solve_ivp
+from scipy.sparse import diags
 import warnings
 
 
@@ -112,16 +113,15 @@ def simulate(linsys, params: Dict[str, Any], options: Optional[Dict[str, Any]] =
     # MATLAB: comp_y = nargout == 4 && ~isempty(linsys.C);
     comp_y = linsys.C.size > 0
     
+    # Get function handle (reads input and disturbance from params_)
+    dynamics = _getfcn(linsys, params_)
+    
     # Loop over all time steps
     for i in range(steps):
         # Input and disturbance are processed in getfcn
         params_['u'] = params['u'][:, i] if params['u'].ndim > 1 else params['u']
         params_['w'] = params['w'][:, i] if params['w'].ndim > 1 else params['w']
         
-        # Get function handle
-        def dynamics(t_val, x_val):
-            return _getfcn(linsys, params_)(t_val, x_val)
-        
         # Simulate using scipy's solve_ivp function with dense output for smooth curves
         try:
             # Use t_eval for smooth curves, but respect options if provided
@@ -273,6 +273,11 @@ def _getfcn(linsys, params):
     Returns:
         Function handle for the dynamics
     """
+    # Diagonal input/disturbance matrices (e.g., from a scalar B or E) are
+    # applied in sparse DIA format, so products cost O(n) per evaluation
+    B = _aux_diagOperator(linsys.B)
+    E = _aux_diagOperator(linsys.E)
+    
     def dynamics(t, x):
         x = np.asarray(x).reshape(-1, 1)
         u = np.asarray(params['u']).reshape(-1, 1)
@@ -290,7 +295,7 @@ def _getfcn(linsys, params):
                     u = np.tile(u, (linsys.B.shape[1], 1))
                 else:
                     raise ValueError(f"Input u has dimension {u.shape[0]} but system expects {linsys.B.shape[1]} inputs")
-            result += linsys.B @ u
+            result += B @ u
         
         if linsys.c.size > 0:
             result += linsys.c.reshape(-1, 1)
@@ -303,13 +308,30 @@ def _getfcn(linsys, params):
                     w = np.tile(w, (linsys.E.shape[1], 1))
                 else:
                     raise ValueError(f"Disturbance w has dimension {w.shape[0]} but system expects {linsys.E.shape[1]} disturbances")
-            result += linsys.E @ w
+            result += E @ w
         
         return result.flatten()
     
     return dynamics
 
 
+def _aux_diagOperator(M):
+    """
+    Returns a square diagonal matrix in sparse DIA format, other matrices
+    are returned unchanged
+    
+    Args:
+        M: system matrix
+    
+    Returns:
+        M or its DIA representation
+    """
+    if M.ndim == 2 and M.shape[0] == M.shape[1] and M.shape[0] > 1 and \
+            np.count_nonzero(M) == np.count_nonzero(M.diagonal()):
+        return diags(M.diagonal(), format='dia')
+    return M
+
+
 def _aux_uwv(obj, params, steps, t_span):
     """
     Set input vector u, disturbance w, and sensor noise v correctly
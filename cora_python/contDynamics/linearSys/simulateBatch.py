@@ -0,0 +1,92 @@
+"""
+simulateBatch - simulates a batch of trajectories of a linear system with
+   piecewise-constant inputs on a fixed time grid
+
+Syntax:
+    X = simulateBatch(linsys, X0, U, timeStep)
+
+Inputs:
+    linsys - linearSys object
+    X0 - initial states (n x samples, or n for a single initial state)
+    U - piecewise-constant inputs (steps x m x samples, or steps x m if all
+        samples share the same input trajectory)
+    timeStep - time step size Delta t
+
+Outputs:
+    X - states at the time points k*Delta t, k = 0..steps
+        (steps+1 x n x samples)
+
+Example:
+    linsys = LinearSys([-1, -4; 4, -1], [1; -1])
+    X0 = randn(2, 100)
+    U = randn(50, 1, 100)
+
+    X = simulateBatch(linsys, X0, U, 0.05)
+
+Other m-files required: none
+Subfunctions: none
+MAT-files required: none
+
+See also: linearSys/simulate
+
+Authors: Python implementation
+Written: 2025
+"""
+
+import numpy as np
+from scipy.linalg import expm
+
+
+def simulateBatch(linsys, X0, U, timeStep: float) -> np.ndarray:
+    """
+    Simulates a batch of trajectories of x' = Ax + Bu + c (without
+    disturbances) using the exact discretization for piecewise-constant inputs
+
+    Args:
+        linsys: LinearSys object
+        X0: Initial states (n x samples, or n for a single initial state)
+        U: Piecewise-constant inputs (steps x m x samples, or steps x m)
+        timeStep: Time step size Delta t
+
+    Returns:
+        np.ndarray: States at the time points k*Delta t (steps+1 x n x samples)
+    """
+    n = linsys.nr_of_dims
+    B = linsys.B
+    m = B.shape[1]
+
+    X0 = np.asarray(X0, dtype=np.float64)
+    if X0.ndim == 1:
+        X0 = X0.reshape(-1, 1)
+    U = np.asarray(U, dtype=np.float64)
+    if U.ndim == 2:
+        U = U[:, :, np.newaxis]
+    if X0.shape[0] != n:
+        raise ValueError("Initial states must have as many rows as the state dimension")
+    if U.ndim != 3 or U.shape[1] != m:
+        raise ValueError("Inputs must be of size steps x m x samples with m the number of inputs")
+    samples = np.broadcast_shapes((X0.shape[1],), (U.shape[2],))[0]
+
+    # exact discretization via the augmented matrix exponential:
+    # expm([[A, B, c], [0, 0, 0]] * dt) = [[Ad, Bd, cd], [0, I, 0]]
+    M = np.zeros((n + m + 1, n + m + 1))
+    M[:n, :n] = linsys.A
+    M[:n, n:n + m] = B
+    M[:n, -1] = linsys.c.ravel()
+    Phi = expm(M * timeStep)
+    Ad = np.ascontiguousarray(Phi[:n, :n])
+
+    # input and offset contributions of all steps in one batched matmul
+    BU = np.matmul(Phi[:n, n:n + m], U)
+    BU += Phi[:n, -1:]
+
+    # only the state recursion remains sequential; each step is one GEMM over
+    # all samples, written directly into the preallocated trajectory array
+    steps = U.shape[0]
+    X = np.empty((steps + 1, n, samples))
+    X[0] = X0
+    for k in range(steps):
+        np.matmul(Ad, X[k], out=X[k + 1])
+        X[k + 1] += BU[k]
+
+    return X
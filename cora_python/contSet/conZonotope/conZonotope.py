@@ -92,14 +92,14 @@ class ConZonotope(ContSet):
 
         # 1. copy constructor
         if len(varargin) == 1 and isinstance(varargin[0], ConZonotope):
-            # Direct assignment like MATLAB
+            # Value semantics like MATLAB: the copy owns its arrays
             other = varargin[0]
-            self.c = other.c
-            self._G = other._G
-            self.A = other.A
-            self.b = other.b
-            self.ksi = other.ksi if hasattr(other, 'ksi') else np.array([])
-            self.R = other.R if hasattr(other, 'R') else np.array([])
+            self.c = _aux_copy(other.c)
+            self._G = _aux_copy(other._G)
+            self.A = _aux_copy(other.A)
+            self.b = _aux_copy(other.b)
+            self.ksi = _aux_copy(other.ksi) if hasattr(other, 'ksi') else np.array([])
+            self.R = _aux_copy(other.R) if hasattr(other, 'R') else np.array([])
             super().__init__()
             self.precedence = 90
             return
@@ -127,6 +127,18 @@ class ConZonotope(ContSet):
         super().__init__()
         self.precedence = 90
 
+    @property
+    def c(self):
+        """Center vector property"""
+        return self._c
+
+    @c.setter
+    def c(self, value):
+        """Setter for c property - keeps the cached dimension in sync"""
+        self._c = value
+        # read by dim(); c is only replaced through this setter
+        self._dim = value.shape[0] if value is not None and value.ndim > 0 else 0
+
     @property
     def G(self):
         """Generator matrix property with automatic dimension fixing"""
@@ -207,7 +219,7 @@ def _aux_parseInputArgs(*varargin) -> Tuple[np.ndarray, np.ndarray, np.ndarray,
     # set default values depending on nargin
     if len(varargin) == 1 or len(varargin) == 3:
         # only center given, or [c,G] with A and b
-        c, A, b = setDefaultValues([[], [], []], list(varargin))
+        c, A, b = setDefaultValues([[], [], []], list(varargin))[0]
         if hasattr(varargin[0], 'shape') and len(varargin[0].shape) > 1 and varargin[0].shape[1] > 0:
             c_matrix = np.array(varargin[0])
             G = c_matrix[:, 1:]
@@ -218,10 +230,10 @@ def _aux_parseInputArgs(*varargin) -> Tuple[np.ndarray, np.ndarray, np.ndarray,
         # c,G or c,G,A,b given
         defaults = [[], [], [], []] if len(varargin) == 4 else [[], [], None, None]
         if len(varargin) == 2:
-            c, G = setDefaultValues(defaults[:2], list(varargin))
+            c, G = setDefaultValues(defaults[:2], list(varargin))[0]
             A, b = np.array([]), np.array([])
         else:
-            c, G, A, b = setDefaultValues(defaults, list(varargin))
+            c, G, A, b = setDefaultValues(defaults, list(varargin))[0]
     else:
         c, G, A, b = np.array([]), np.array([]), np.array([]), np.array([])
 
@@ -306,4 +318,8 @@ def _aux_computeProperties(c: np.ndarray, G: np.ndarray, A: np.ndarray, b: np.nd
     A = A.astype(float)
     b = b.astype(float)
 
-    return c, G, A, b 
\ No newline at end of file
+    return c, G, A, b 
+
+def _aux_copy(x):
+    """Copy of an array attribute (other values are kept)"""
+    return x.copy() if isinstance(x, np.ndarray) else x
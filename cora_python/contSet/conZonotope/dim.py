@@ -41,6 +41,6 @@ def dim(cZ: 'ConZonotope') -> int:
         n: dimension of the ambient space
     """
     
-    # Simply return the number of rows in the center vector
+    # Number of rows in the center vector, cached by the c setter
     # This matches MATLAB: n = size(cZ.c,1);
-    return cZ.c.shape[0] 
\ No newline at end of file
+    return cZ._dim 
\ No newline at end of file
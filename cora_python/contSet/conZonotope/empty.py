@@ -23,6 +23,7 @@ Python translation: 2025
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -42,10 +43,24 @@ def empty(n: int = 0) -> 'ConZonotope':
     
     from .conZonotope import ConZonotope
     
+    # Copy of a cached template (skips input parsing and checks); the copy
+    # constructor copies all arrays, so the template is never modified
+    return ConZonotope(_aux_emptyTemplate(n))
+
+
+@lru_cache(maxsize=128)
+def _aux_emptyTemplate(n: int) -> 'ConZonotope':
+    """Template empty conZonotope of dimension n with read-only arrays"""
+    
+    from .conZonotope import ConZonotope
+    
     # Create empty center and generator matrix
     c = np.zeros((n, 1)) if n > 0 else np.zeros((0, 1))
     G = np.zeros((n, 0)) if n > 0 else np.zeros((0, 0))
     A = np.zeros((0, 0))
     b = np.zeros((0, 1))
     
-    return ConZonotope(c, G, A, b) 
\ No newline at end of file
+    cZ = ConZonotope(c, G, A, b)
+    for arr in (cZ.c, cZ.G, cZ.A, cZ.b, cZ.ksi, cZ.R):
+        arr.flags.writeable = False
+    return cZ
@@ -0,0 +1,28 @@
+"""
+_dispatch - shared helpers for dispatching the contSet base implementations
+to the set classes
+
+Not all set classes take every optional argument of the base
+implementation, so the number of arguments passed to an override is chosen
+by its signature.
+"""
+
+import inspect
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def num_positional_args(impl) -> float:
+    """
+    Returns the number of positional arguments a function accepts
+
+    Args:
+        impl: function
+
+    Returns:
+        float: number of positional arguments (inf for *args)
+    """
+    params = inspect.signature(impl).parameters.values()
+    if any(p.kind == p.VAR_POSITIONAL for p in params):
+        return float('inf')
+    return sum(p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in params)
@@ -0,0 +1,40 @@
+"""
+_errors - shared error construction for the contSet base implementations
+
+The base implementations in this package raise these errors when a set class
+does not override the respective function.
+"""
+
+from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
+
+
+def noops_error(op: str, *objs, details: str = '') -> CORAerror:
+    """
+    Builds the 'CORA:noops' error for a function not implemented for the
+    classes of the given arguments
+
+    Args:
+        op: name of the function
+        *objs: arguments whose classes are listed in the message
+        details: optional description of further arguments (e.g., 'type exact')
+
+    Returns:
+        CORAerror: error to be raised by the caller
+    """
+    msg = f'{op} not implemented for ' + ' and '.join(type(o).__name__ for o in objs)
+    if details:
+        msg += f' with {details}'
+    return CORAerror('CORA:noops', msg)
+
+
+def not_supported_error(msg: str) -> CORAerror:
+    """
+    Builds the 'CORA:notSupported' error with the given message
+
+    Args:
+        msg: error message
+
+    Returns:
+        CORAerror: error to be raised by the caller
+    """
+    return CORAerror('CORA:notSupported', msg)
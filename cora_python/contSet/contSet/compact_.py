@@ -40,11 +40,9 @@ def compact_(S: 'ContSet', method: Optional[str] = None, tol: Optional[float] =
         >>> S = zonotope(center, generators)
         >>> S_compact = compact_(S, 'zeros', 1e-10)
     """
-    base_class = type(S).__bases__[0] if type(S).__bases__ else None
-    if (hasattr(type(S), 'compact_') and 
-        base_class and hasattr(base_class, 'compact_') and
-        type(S).compact_ is not base_class.compact_):
-        return type(S).compact_(method, tol)
+    impl = getattr(type(S), 'compact_', None)
+    if impl is not None and impl is not compact_:
+        return impl(S, method, tol)
     else:
         # This is overridden in subclass if implemented; throw error
         raise CORAerror('CORA:noops',
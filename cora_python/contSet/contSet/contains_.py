@@ -61,11 +61,9 @@ def contains_(S1: 'ContSet', S2: Union['ContSet', np.ndarray], method='exact', t
             - scaling: scaling factor
     """
     # Check if subclass has overridden contains_ method
-    base_class = type(S1).__bases__[0] if type(S1).__bases__ else None
-    if (hasattr(type(S1), 'contains_') and 
-        base_class and hasattr(base_class, 'contains_') and
-        type(S1).contains_ is not base_class.contains_):
-        return type(S1).contains_(S2, method, tol, maxEval, cert_toggle, scaling_toggle)
+    impl = getattr(type(S1), 'contains_', None)
+    if impl is not None and impl is not contains_:
+        return impl(S1, S2, method, tol, maxEval, cert_toggle, scaling_toggle)
     else:
         # Base implementation - throw error as this method should be overridden
         raise CORAerror("CORA:noops", f"Function contains_ not implemented for class {type(S1).__name__}") 
\ No newline at end of file
@@ -37,11 +37,9 @@ def convHull_(S: 'ContSet', S2: Optional['ContSet'] = None, method: str = 'exact
         CORAerror: If convHull_ is not implemented for the specific set type
     """
     # Check if subclass has overridden convHull_ method
-    base_class = type(S).__bases__[0] if type(S).__bases__ else None
-    if (hasattr(type(S), 'convHull_') and 
-        base_class and hasattr(base_class, 'convHull_') and
-        type(S).convHull_ is not base_class.convHull_):
-        return type(S).convHull_(S, S2, method)
+    impl = getattr(type(S), 'convHull_', None)
+    if impl is not None and impl is not convHull_:
+        return impl(S, S2, method)
     else:
         # Base implementation - throw error as this method should be overridden
         raise CORAerror("CORA:noops", f"Function convHull_ not implemented for class {type(S).__name__}") 
\ No newline at end of file
@@ -46,10 +46,8 @@ def dim(S: 'ContSet') -> int:
         int: dimension of the ambient space
     """
     # Check if subclass has overridden dim method
-    base_class = type(S).__bases__[0] if type(S).__bases__ else None
-    if (hasattr(type(S), 'dim') and 
-        base_class and hasattr(base_class, 'dim') and
-        type(S).dim is not base_class.dim):
-        return type(S).dim(S)
+    impl = getattr(type(S), 'dim', None)
+    if impl is not None and impl is not dim:
+        return impl(S)
     else:
         return 0
\ No newline at end of file
@@ -1,4 +1,4 @@
-from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
+from ._errors import noops_error
 
 def enclose(self, *varargin):
     """
@@ -23,5 +23,10 @@ def enclose(self, *varargin):
         S - contSet object
     """
 
+    # Dispatch to the set class if it overrides this base implementation
+    impl = getattr(type(self), 'enclose', None)
+    if impl is not None and impl is not enclose:
+        return impl(self, *varargin)
+    
     # is overridden in subclass if implemented; throw error
-    raise CORAerror("CORA:noops", self, *varargin) 
\ No newline at end of file
+    raise noops_error('enclose', self, *varargin) 
\ No newline at end of file
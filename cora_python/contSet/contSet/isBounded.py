@@ -9,7 +9,7 @@ Written: 24-July-2023 (MATLAB)
 Python translation: 2025
 """
 
-from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
+from ._errors import noops_error
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -37,6 +37,10 @@ def isBounded(S: 'ContSet') -> bool:
         >>> # result is True for zonotopes
     """
     
+    # Dispatch to the set class if it overrides this base implementation
+    impl = getattr(type(S), 'isBounded', None)
+    if impl is not None and impl is not isBounded:
+        return impl(S)
+    
     # Fallback error for base contSet objects
-    raise CORAerror('CORA:noops',
-                   f'isBounded not implemented for {type(S).__name__}') 
\ No newline at end of file
+    raise noops_error('isBounded', S) 
\ No newline at end of file
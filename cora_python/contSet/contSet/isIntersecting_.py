@@ -12,7 +12,7 @@ Python translation: 2025
 
 from typing import TYPE_CHECKING, Union
 import numpy as np
-from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
+from ._errors import noops_error
 
 if TYPE_CHECKING:
     from cora_python.contSet.contSet.contSet import ContSet
@@ -45,12 +45,10 @@ def isIntersecting_(S1: Union['ContSet', np.ndarray],
         >>> S2 = interval([2.5, 3], [4.5, 5])
         >>> result = isIntersecting_(S1, S2, 'exact')
     """
-    base_class = type(S1).__bases__[0] if type(S1).__bases__ else None
-    if (hasattr(type(S1), 'isIntersecting_') and 
-        base_class and hasattr(base_class, 'isIntersecting_') and
-        type(S1).isIntersecting_ is not base_class.isIntersecting_):
-        return type(S1).isIntersecting_(S2, type_, tol)
+    # Dispatch to the subclass if it overrides this base implementation
+    impl = getattr(type(S1), 'isIntersecting_', None)
+    if impl is not None and impl is not isIntersecting_:
+        return impl(S1, S2, type_, tol)
     else:
         # This is overridden in subclass if implemented; throw error
-        raise CORAerror('CORA:noops',
-                       f'isIntersecting_ not implemented for {type(S1).__name__} and {type(S2).__name__} with type {type_}') 
\ No newline at end of file
+        raise noops_error('isIntersecting_', S1, S2, details=f'type {type_}') 
\ No newline at end of file
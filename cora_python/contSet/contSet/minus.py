@@ -12,11 +12,20 @@ Python translation: 2025
 
 from typing import TYPE_CHECKING, Union
 import numpy as np
-from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
+from ._errors import not_supported_error
 
 if TYPE_CHECKING:
     from cora_python.contSet.contSet.contSet import ContSet
-    
+
+_MSG = ('The function "minus" is not implemented for the class {} '
+        'except for vectors as a subtrahend.\n'
+        'If you require to compute the Minkowski difference, use "minkDiff" instead.')
+
+# numeric scalar types; isinstance against this tuple avoids the
+# numbers-ABC walk of np.isscalar
+_SCALAR_TYPES = (int, float, complex, np.number)
+_NUMERIC_TYPES = (np.ndarray, list, tuple) + _SCALAR_TYPES
+
 def minus(S: Union['ContSet', np.ndarray], p: Union['ContSet', np.ndarray]) -> 'ContSet':
     """
     Translation of a set by a vector
@@ -26,7 +35,8 @@ def minus(S: Union['ContSet', np.ndarray], p: Union['ContSet', np.ndarray]) -> '
         p: vector or contSet object (subtrahend)
         
     Returns:
-        ContSet: Result of subtraction
+        ContSet: Result of subtraction (S itself if p is the origin, i.e., the
+            result may share state with S)
         
     Raises:
         CORAerror: If operation is not supported
@@ -36,18 +46,27 @@ def minus(S: Union['ContSet', np.ndarray], p: Union['ContSet', np.ndarray]) -> '
         >>> p = np.array([0.5, 0.5])
         >>> result = minus(S, p)  # or result = S - p
     """
-    if isinstance(p, (np.ndarray, list, tuple)) or np.isscalar(p):
-        # Subtrahend is numeric, call 'plus' with negated vector
-        return S.plus(-np.array(p))
+    if isinstance(p, np.ndarray):
+        # Translation by the origin (e.g., default offsets): nothing to do
+        if p.ndim >= 1 and p.size and p.shape[0] == p.size and not np.count_nonzero(p) \
+                and S.dim() == p.size:
+            return S
+        # Subtrahend is numeric, call 'plus' with negated vector (single pass,
+        # no intermediate copy)
+        return S.plus(np.negative(p))
+    
+    elif isinstance(p, _SCALAR_TYPES):
+        if p == 0:
+            return S
+        return S.plus(-p)
+    
+    elif isinstance(p, (list, tuple)):
+        return S.plus(np.negative(np.asarray(p)))
     
-    elif isinstance(S, (np.ndarray, list, tuple)) or np.isscalar(S):
+    elif isinstance(S, _NUMERIC_TYPES):
         # Minuend is a vector, subtrahend is a set
         return S.plus(p.uminus())
     
     else:
         # Throw error for unsupported operations
-        classname = type(S).__name__
-        raise CORAerror('CORA:notSupported',
-                       f'The function "minus" is not implemented for the class {classname} '
-                       f'except for vectors as a subtrahend.\n'
-                       f'If you require to compute the Minkowski difference, use "minkDiff" instead.') 
\ No newline at end of file
+        raise not_supported_error(_MSG.format(type(S).__name__)) 
\ No newline at end of file
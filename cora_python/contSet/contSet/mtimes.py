@@ -11,7 +11,7 @@ Python translation: 2025
 
 from typing import TYPE_CHECKING, Union
 import numpy as np
-from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
+from ._errors import noops_error
 
 if TYPE_CHECKING:
     from cora_python.contSet.contSet.contSet import ContSet
@@ -41,6 +41,11 @@ def mtimes(M: Union[np.ndarray, float, int], S: 'ContSet') -> 'ContSet':
         >>> result = mtimes(M, S)  # or result = M * S
     """
     
+    # Dispatch to the set class if it overrides this base implementation; the
+    # class attribute lookup is served by the type's method cache
+    impl = getattr(type(S), 'mtimes', None)
+    if impl is not None and impl is not mtimes:
+        return impl(M, S)
+    
     # Fallback error
-    raise CORAerror('CORA:noops',
-                   f'mtimes not implemented for {type(M).__name__} and {type(S).__name__}') 
\ No newline at end of file
+    raise noops_error('mtimes', M, S) 
\ No newline at end of file
@@ -12,7 +12,7 @@ Python translation: 2025
 
 from typing import TYPE_CHECKING, Union, Tuple
 import numpy as np
-from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
+from ._errors import noops_error
 
 if TYPE_CHECKING:
     from cora_python.contSet.contSet.contSet import ContSet
@@ -40,12 +40,10 @@ def norm_(S: 'ContSet', norm_type: Union[int, float, str] = 2, mode: str = 'ub')
         >>> S = interval([1, 2], [3, 4])
         >>> norm_val = norm_(S, 2, 'ub')
     """
-    base_class = type(S).__bases__[0] if type(S).__bases__ else None
-    if (hasattr(type(S), 'norm_') and 
-        base_class and hasattr(base_class, 'norm_') and
-        type(S).norm_ is not base_class.norm_):
-        return type(S).norm_(norm_type, mode)
+    # Dispatch to the subclass if it overrides this base implementation
+    impl = getattr(type(S), 'norm_', None)
+    if impl is not None and impl is not norm_:
+        return impl(S, norm_type, mode)
     else:
         # This is overridden in subclass if implemented; throw error
-        raise CORAerror('CORA:noops',
-                    f'norm_ not implemented for {type(S).__name__} with norm_type {norm_type} and mode {mode}') 
\ No newline at end of file
+        raise noops_error('norm_', S, details=f'norm_type {norm_type} and mode {mode}') 
\ No newline at end of file
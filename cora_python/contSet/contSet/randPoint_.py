@@ -37,11 +37,9 @@ def randPoint_(S: 'ContSet', N: int = 1, method: str = 'standard') -> np.ndarray
         CORAerror: If randPoint_ is not implemented for the specific set type
     """
     # Check if subclass has overridden randPoint_ method
-    base_class = type(S).__bases__[0] if type(S).__bases__ else None
-    if (hasattr(type(S), 'randPoint_') and 
-        base_class and hasattr(base_class, 'randPoint_') and
-        type(S).randPoint_ is not base_class.randPoint_):
-        return type(S).randPoint_(S, N, method)
+    impl = getattr(type(S), 'randPoint_', None)
+    if impl is not None and impl is not randPoint_:
+        return impl(S, N, method)
     else:
         # Base implementation - throw error as this method should be overridden
         raise CORAerror("CORA:noops", f"Function randPoint_ not implemented for class {type(S).__name__}") 
\ No newline at end of file
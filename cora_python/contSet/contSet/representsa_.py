@@ -30,6 +30,7 @@ Last revision: ---
 """
 
 from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
+from ._dispatch import num_positional_args
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -56,11 +57,12 @@ def representsa_(S: 'ContSet', set_type: str, tol: float = 1e-12, method: str =
     Raises:
         CORAerror: If representsa_ is not implemented for the specific set type
     """
-    base_class = type(S).__bases__[0] if type(S).__bases__ else None
-    if (hasattr(type(S), 'representsa_') and 
-        base_class and hasattr(base_class, 'representsa_') and
-        type(S).representsa_ is not base_class.representsa_):
-        return type(S).representsa_(set_type, tol, method, iter, splits)
+    impl = getattr(type(S), 'representsa_', None)
+    if impl is not None and impl is not representsa_:
+        # Some classes do not take method, iter, and splits
+        if num_positional_args(impl) >= 6:
+            return impl(S, set_type, tol, method, iter, splits)
+        return impl(S, set_type, tol)
     else:
         # Base implementation - throw error as this method should be overridden
         raise CORAerror("CORA:noops", f"Function representsa_ not implemented for class {type(S).__name__}")
\ No newline at end of file
@@ -13,6 +13,7 @@ Python translation: 2025
 from typing import Union, Tuple, TYPE_CHECKING
 import numpy as np
 from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
+from ._dispatch import num_positional_args
 
 if TYPE_CHECKING:
     from cora_python.contSet.contSet.contSet import ContSet
@@ -50,11 +51,12 @@ def supportFunc_(S: 'ContSet',
         >>> val = supportFunc_(S, direction, 'upper')
     """
     # Check if subclass has overridden supportFunc_ method
-    base_class = type(S).__bases__[0] if type(S).__bases__ else None
-    if (hasattr(type(S), 'supportFunc_') and 
-        base_class and hasattr(base_class, 'supportFunc_') and
-        type(S).supportFunc_ is not base_class.supportFunc_):
-        return type(S).supportFunc_(direction, type_, method, max_order_or_splits, tol)
+    impl = getattr(type(S), 'supportFunc_', None)
+    if impl is not None and impl is not supportFunc_:
+        # Some classes do not take method, order/splits, and tolerance
+        if num_positional_args(impl) >= 6:
+            return impl(S, direction, type_, method, max_order_or_splits, tol)
+        return impl(S, direction, type_)
     else:
         # Base implementation - throw error as this method should be overridden
         raise CORAerror('CORA:noops',
@@ -33,11 +33,9 @@ def uminus(S: 'ContSet') -> 'ContSet':
         >>> neg_S = uminus(S)  # or neg_S = -S
     """
     # Check if subclass has overridden uminus method
-    base_class = type(S).__bases__[0] if type(S).__bases__ else None
-    if (hasattr(type(S), 'uminus') and 
-        base_class and hasattr(base_class, 'uminus') and
-        type(S).uminus is not base_class.uminus):
-        return type(S).uminus(S)
+    impl = getattr(type(S), 'uminus', None)
+    if impl is not None and impl is not uminus:
+        return impl(S)
     
     # Fallback: implement as multiplication by -1
     return S.times(-1) 
\ No newline at end of file
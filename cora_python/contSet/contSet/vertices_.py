@@ -42,16 +42,14 @@ def vertices_(S: 'ContSet', method: str = 'convHull', *args, **kwargs) -> np.nda
         >>> V = vertices_(S, 'convHull')
     """
     # Check if subclass has overridden vertices_ method
-    base_class = type(S).__bases__[0] if type(S).__bases__ else None
-    if (hasattr(type(S), 'vertices_') and 
-        base_class and hasattr(base_class, 'vertices_') and
-        type(S).vertices_ is not base_class.vertices_):
+    impl = getattr(type(S), 'vertices_', None)
+    if impl is not None and impl is not vertices_:
         # Try calling with method first, fallback to no method for interval-like classes
         try:
-            return type(S).vertices_(S, method, *args, **kwargs)
+            return impl(S, method, *args, **kwargs)
         except TypeError:
             # Some implementations (like interval) don't take method parameter
-            return type(S).vertices_(S, *args, **kwargs)
+            return impl(S, *args, **kwargs)
     else:
         # Base implementation - throw error as this method should be overridden
         raise CORAerror('CORA:noops',
@@ -17,6 +17,7 @@ Python translation: 2025
 """
 
 import numpy as np
+from functools import lru_cache
 
 from .interval import Interval
 
@@ -30,7 +31,14 @@ def empty(n: int = 0) -> 'Interval':
     Returns:
         Empty interval object
     """
+    # Copy of a cached template (skips input parsing and checks)
+    return Interval(_aux_emptyTemplate(n))
+
+
+@lru_cache(maxsize=128)
+def _aux_emptyTemplate(n: int) -> 'Interval':
+    """Template empty interval of dimension n"""
     # Create empty interval with proper dimensions
     # In MATLAB: Interval(zeros(n,0))
     empty_array = np.zeros((n, 0))
-    return Interval(empty_array) 
+    return Interval(empty_array)
@@ -32,15 +32,27 @@ Last update: 31-October-2024 (TL, added v-polytope/contains) (MATLAB)
 Python translation: 2025
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from typing import Union, Tuple, Any
+from scipy.sparse import csr_matrix
 from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
+from cora_python.g.macros import LOWER_PRECISION_ENABLED
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .polytope import Polytope
     from cora_python.contSet.contSet import ContSet
 
+# constraint matrices with at least this many entries and a density below
+# _SPARSE_MAX_DENSITY are multiplied in CSR format
+_SPARSE_MIN_SIZE = 4096
+_SPARSE_MAX_DENSITY = 0.1
+
+# number of points per chunk for large point clouds
+_CHUNK_SIZE = 8192
+
 def contains_(P: 'Polytope', S: Union[np.ndarray, 'ContSet'], method: str = 'exact', 
               tol: float = 1e-12, maxEval: int = 0, certToggle: bool = True, 
               scalingToggle: bool = False) -> Tuple[Union[bool, np.ndarray], bool, Union[float, np.ndarray]]:
@@ -111,56 +123,124 @@ def _contains_pointcloud(P, points: np.ndarray, method: str, tol: float,
         raise CORAerror('CORA:notSupported', 
                        'Polytope containment requires halfspace representation (A matrix is missing).')
     
-    # Initialize results
-    results = np.zeros(num_points, dtype=bool)
-    scaling_factors = np.ones(num_points) * np.inf
+    # Large point clouds are processed in column chunks: the residuals of a
+    # chunk stay in cache, and the chunks are distributed over threads (the
+    # NumPy kernels release the GIL); for small clouds the overhead dominates
+    if num_points > _CHUNK_SIZE:
+        chunks = [points[:, i:i + _CHUNK_SIZE] for i in range(0, num_points, _CHUNK_SIZE)]
+        def check(chunk):
+            return _contains_pointcloud(P, chunk, method, tol, certToggle, scalingToggle)
+        workers = min(os.cpu_count() or 1, len(chunks))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                out = list(executor.map(check, chunks))
+        else:
+            out = [check(chunk) for chunk in chunks]
+        results = np.concatenate([np.atleast_1d(res) for res, _, _ in out])
+        scaling_factors = np.concatenate([np.atleast_1d(scaling) for _, _, scaling in out])
+        return results, True, scaling_factors
     
-    # Check each point
-    for i in range(num_points):
-        point = points[:, i:i+1]
-        
-        # Assume contained until a violation is found
-        is_contained = True
-
-        # Check inequality constraints A*x <= b, if they exist
-        if P.A.shape[0] > 0:
-            violations = P.A @ point - P.b
-            max_violation = np.max(violations)
-            
-            if max_violation > tol:
-                is_contained = False
-
-            # Compute scaling factor if requested
-            if scalingToggle:
-                if is_contained:
-                    scaling_factors[i] = 1.0 # Already inside
-                else:
-                    # For non-contained points, compute required scaling
-                    b_norm = np.linalg.norm(P.b)
-                    if b_norm > 1e-9:
-                        scaling_factors[i] = 1.0 + max_violation / b_norm
-                    else:
-                        scaling_factors[i] = 1.0 + max_violation
-
-        # Check equality constraints if present
-        if P.Ae is not None and P.Ae.shape[0] > 0:
-            eq_violations = np.abs(P.Ae @ point - P.be)
-            max_eq_violation = np.max(eq_violations)
-            
-            if max_eq_violation > tol:
-                is_contained = False
+    # Pre-filter with the bounding box if it is cheaply available: points
+    # outside the box are not contained, only the others are checked against
+    # the halfspaces (scaling factors need the full check for all points)
+    bbox = None if scalingToggle else _aux_bbox(P)
+    if bbox is not None:
+        lb, ub = bbox
+        in_box = ~np.any((points < lb - tol) | (points > ub + tol), axis=0)
+        if not in_box.all():
+            results = np.zeros(num_points, dtype=bool)
+            if in_box.any():
+                results[in_box] = _contains_pointcloud(P, points[:, in_box], method, tol,
+                                                       certToggle, scalingToggle)[0]
+            if num_points == 1:
+                return bool(results[0]), True, np.inf
+            return results, True, np.full(num_points, np.inf)
+    
+    # Assume all points contained until a violation is found
+    results = np.ones(num_points, dtype=bool)
+    scaling_factors = np.full(num_points, np.inf)
+    
+    # Check inequality constraints A*x <= b for all points at once, if they exist
+    if P.A.shape[0] > 0:
+        max_violation = _aux_maxResidual(_aux_constraintMatrix(P, 'A'), P.b, points)
+        results = max_violation <= tol
         
-        results[i] = is_contained
+        # Compute scaling factor if requested: 1 for points satisfying the
+        # inequality constraints, otherwise the required scaling
+        if scalingToggle:
+            b_norm = np.linalg.norm(P.b)
+            denom = b_norm if b_norm > 1e-9 else 1.0
+            scaling_factors = np.where(results, 1.0, 1.0 + max_violation / denom)
     
-    # Final check for scaling factors for points that were initially outside
-    # but might be considered inside due to tolerance.
-    if scalingToggle:
-        results_bool = results.astype(bool)
-        scaling_factors[results_bool] = np.minimum(scaling_factors[results_bool], 1.0)
-
+    # Check equality constraints if present, only for points that satisfy the
+    # inequality constraints (the scaling factors only depend on the latter)
+    if P.Ae is not None and P.Ae.shape[0] > 0:
+        inside = np.flatnonzero(results)
+        if inside.size == num_points:
+            results = _aux_maxResidual(_aux_constraintMatrix(P, 'Ae'), P.be, points, absolute=True) <= tol
+        elif inside.size > 0:
+            results[inside] = _aux_maxResidual(_aux_constraintMatrix(P, 'Ae'), P.be, points[:, inside],
+                                               absolute=True) <= tol
+    
+    # Without inequality constraints, contained points have scaling factor 1
+    if scalingToggle and P.A.shape[0] == 0:
+        scaling_factors = np.where(results, 1.0, np.inf)
 
     # Return results
     if num_points == 1:
         return bool(results[0]), True, float(scaling_factors[0])
     else:
-        return results, True, scaling_factors 
\ No newline at end of file
+        return results, True, scaling_factors 
+
+
+def _aux_maxResidual(M: np.ndarray, rhs: np.ndarray, points: np.ndarray,
+                     absolute: bool = False) -> np.ndarray:
+    """
+    Column-wise maximum of the constraint residual M @ points - rhs (or its
+    absolute value); the product is the only temporary, all further steps
+    operate on it in place (see LOWER_PRECISION_ENABLED for its precision)
+    """
+    # float32 inputs stay in single precision only if explicitly allowed
+    if LOWER_PRECISION_ENABLED():
+        dtype = np.promote_types(np.result_type(M.dtype, points.dtype), np.float32)
+    else:
+        dtype = np.float64
+    # the product is kept as M @ points (one row per constraint): BLAS handles
+    # the layout of points itself, and the transposed form points.T @ M.T
+    # followed by a row-wise max was measured to be slower for tall point
+    # clouds (many points, few constraints)
+    R = np.asarray(M @ points, dtype=dtype)
+    np.subtract(R, rhs.reshape(-1, 1), out=R)
+    if absolute:
+        np.abs(R, out=R)
+    return R.max(axis=0)
+
+
+def _aux_bbox(P) -> Union[Tuple[np.ndarray, np.ndarray], None]:
+    """
+    Bounding box (lb, ub) of a polytope if it is cached (see interval) or
+    can be read off the vertices; None otherwise, since computing it from
+    the halfspace representation requires 2n linear programs
+    """
+    if P._bbox is None and P._isVRep and P._V.size > 0:
+        P._bbox = (P._V.min(axis=1, keepdims=True), P._V.max(axis=1, keepdims=True))
+    return P._bbox
+
+
+def _aux_constraintMatrix(P, name: str):
+    """
+    Constraint matrix P.A or P.Ae for the residual computation: a cached CSR
+    copy if the matrix is large and sparse, otherwise the dense matrix; the
+    cache entry is tied to the array object, so reassigning the matrix (as
+    done, e.g., in mtimes) invalidates it
+    """
+    M = getattr(P, name)
+    cached = P._sparseCache.get(name)
+    if cached is not None and cached[0] is M:
+        return cached[1]
+    
+    M_ = M
+    if M.size >= _SPARSE_MIN_SIZE and np.count_nonzero(M) < _SPARSE_MAX_DENSITY * M.size:
+        M_ = csr_matrix(M)
+    P._sparseCache[name] = (M, M_)
+    return M_
@@ -69,6 +69,7 @@ def interval(P: 'Polytope') -> Interval:
     
     # exit if already empty
     if empty:
+        P._bbox = (np.full((n, 1), np.inf), np.full((n, 1), -np.inf))
         return Interval.empty(n)
     
     # init lower and upper bounds of resulting interval with Inf values
@@ -94,5 +95,8 @@ def interval(P: 'Polytope') -> Interval:
     if np.sum(~idx_ub) > 0:
         lb[idx_nonInf_lb] = -b[nnz_ub:].reshape(-1, 1)
     
+    # cache bounding box for later use (e.g., pre-filter in contains_)
+    P._bbox = (lb.copy(), ub.copy())
+    
     # instantiate resulting interval
     return Interval(lb, ub) 
\ No newline at end of file
@@ -36,12 +36,13 @@ def isemptyobject(P: 'Polytope') -> bool:
     """
     
     # The emptiness is determined during construction and stored in _emptySet
-    if hasattr(P, '_emptySet') and P._emptySet is not None:
-        return P._emptySet
+    # (both constructor paths always set it, so no hasattr checks needed)
+    empty = P._emptySet
+    if empty is not None:
+        return empty
     
-    # Fallback for older/uninitialized objects, though this path shouldn't be
-    # taken with the new constructor.
-    if hasattr(P, '_isVRep') and P._isVRep:
+    # Emptiness unknown: trivial for the vertex representation
+    if P._isVRep:
         return P._V is None or P._V.size == 0
     
     # For H-representation, determining emptiness is non-trivial and
@@ -3,8 +3,10 @@
 # All rights reserved.
 
 import numpy as np
+from functools import lru_cache
+
 from cora_python.contSet.polytope.polytope import Polytope
-from cora_python.g.functions.matlab.validate.check.input_args_check import input_args_check
+from cora_python.g.functions.matlab.validate.check.inputArgsCheck import inputArgsCheck
 
 def origin(n: int) -> 'Polytope':
     """
@@ -23,13 +25,19 @@ def origin(n: int) -> 'Polytope':
        P = Polytope.origin(2);
     """
 
-    input_args_check([[n, ['att', 'numeric'], ['scalar', 'positive', 'integer']]])
+    inputArgsCheck([[n, 'att', 'numeric', ['scalar', 'positive', 'integer']]])
+
+    # Copy of a cached template (the copy constructor copies all arrays, so
+    # the template is never modified)
+    return Polytope(_aux_originTemplate(int(n)))
 
+
+@lru_cache(maxsize=128)
+def _aux_originTemplate(n: int) -> 'Polytope':
+    """Template polytope representing the origin in dimension n"""
     # init halfspace representation (simplex with zero offset)
     A = np.vstack((np.eye(n), -np.ones((1, n))))
     b = np.zeros((n + 1, 1))
     
     # Create polytope from H-representation
-    P = Polytope(A, b)
-
-    return P 
\ No newline at end of file
+    return Polytope(A, b) 
\ No newline at end of file
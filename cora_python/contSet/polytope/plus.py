@@ -4,6 +4,7 @@ from cora_python.g.functions.matlab.validate.preprocessing import find_class_arg
 from cora_python.g.functions.matlab.validate.check import equal_dim_check
 from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
 from cora_python.contSet.contSet.reorder import reorder
+from .representsa_ import representsa_
 
 if TYPE_CHECKING:
     from cora_python.contSet.polytope.polytope import Polytope
@@ -19,15 +20,12 @@ def _aux_plus_Hpoly_Hpoly(P1: 'Polytope', P2: 'Polytope', n: int) -> 'Polytope':
     A1, b1, Ae1, be1 = P1.A, P1.b, P1.Ae, P1.be
     A2, b2, Ae2, be2 = P2.A, P2.b, P2.Ae, P2.be
 
-    Z_A = np.zeros((A1.shape[0], A2.shape[1]))
-
-    A = np.block([[A2, -A2], [Z_A, A1]])
+    A = _aux_liftedBlock(A2, A1)
     b = np.vstack([b2, b1])
     
     # Handle equality constraints (may be None)
     if Ae1 is not None and Ae2 is not None:
-        Z_Ae = np.zeros((Ae1.shape[0], Ae2.shape[1]))
-        Ae = np.block([[Ae2, -Ae2], [Z_Ae, Ae1]])
+        Ae = _aux_liftedBlock(Ae2, Ae1)
         be = np.vstack([be2, be1])
         P_highdim = Polytope(A, b, Ae, be)
     elif Ae1 is not None:
@@ -46,18 +44,23 @@ def _aux_plus_Hpoly_Hpoly(P1: 'Polytope', P2: 'Polytope', n: int) -> 'Polytope':
 
     return project(P_highdim, list(range(1, n + 1)))
 
+def _aux_liftedBlock(M2: np.ndarray, M1: np.ndarray) -> np.ndarray:
+    # [[M2, -M2], [0, M1]] written into a single pre-allocated array
+    m2, k = M2.shape
+    M = np.empty((m2 + M1.shape[0], k + M1.shape[1]), dtype=np.result_type(M1, M2))
+    M[:m2, :k] = M2
+    np.negative(M2, out=M[:m2, k:])
+    M[m2:, :k] = 0
+    M[m2:, k:] = M1
+    return M
+
 def _aux_plus_Vpoly_Vpoly(P1: 'Polytope', P2: 'Polytope', n: int) -> 'Polytope':
     from cora_python.contSet.polytope.polytope import Polytope
     V1, V2 = P1.V, P2.V
-    num_v1, num_v2 = V1.shape[1], V2.shape[1]
     
-    # Create all combinations of vertices from V1 and V2
-    V = np.zeros((n, num_v1 * num_v2))
-    idx = 0
-    for i in range(num_v2):
-        for j in range(num_v1):
-            V[:, idx] = V1[:, j] + V2[:, i]
-            idx += 1
+    # Create all combinations of vertices from V1 and V2 by broadcasting;
+    # column i*num_v1 + j holds V2[:, i] + V1[:, j]
+    V = (V2[:, :, np.newaxis] + V1[:, np.newaxis, :]).reshape(n, -1)
         
     return Polytope(V)
 
@@ -75,9 +78,12 @@ def _aux_plus_poly_point(P: 'Polytope', S: np.ndarray) -> 'Polytope':
         A, b, Ae, be = priv_plus_minus_vector(P._A, P._b, P._Ae, P._be, S)
         P_out = Polytope(A, b, Ae, be)
     elif P._isVRep:
-        # For vertex representation, just add the vector to all vertices
-        V_new = P._V + S # Broadcasting should handle this
-        P_out = Polytope(V_new)
+        # For vertex representation, just add the vector to all vertices; the
+        # copy carries over the translation-invariant hidden properties, so
+        # the constructor's degeneracy check (SVD of the vertices) is skipped
+        P_out = Polytope(P)
+        P_out._V = P_out._V.astype(np.result_type(P_out._V, S), copy=False)
+        P_out._V += S
     else:
         # This case should not be reached with the new constructor
         # Force computation of H-rep and use that
@@ -88,6 +94,18 @@ def _aux_plus_poly_point(P: 'Polytope', S: np.ndarray) -> 'Polytope':
         
     return P_out
 
+def _aux_representsa(P: 'Polytope', set_type: str, tol: float) -> bool:
+    # memoized representsa_ check; the cache entry is tied to the current
+    # representation arrays, so reassigning any of them invalidates it
+    key = (set_type, tol)
+    reps = (P._A, P._b, P._Ae, P._be, P._V)
+    cached = P._representsaCache.get(key)
+    if cached is not None and all(r is r_ for r, r_ in zip(cached[0], reps)):
+        return cached[1]
+    res = bool(representsa_(P, set_type, tol))
+    P._representsaCache[key] = (reps, res)
+    return res
+
 def _aux_setproperties(P_out: 'Polytope', P: 'Polytope', S: Union['Polytope', np.ndarray]) -> 'Polytope':
     # In the function-based approach, we don't set properties directly.
     # Properties like boundedness and full-dimensionality will be computed 
@@ -116,13 +134,13 @@ def plus(p1: Union['Polytope', np.ndarray], p2: Union['Polytope', np.ndarray]) -
         has_h2_orig = p2._isHRep
         
         # Special case checks
-        if p1.representsa('fullspace', tol) or p2.representsa('fullspace', tol):
+        if _aux_representsa(p1, 'fullspace', tol) or _aux_representsa(p2, 'fullspace', tol):
             return Polytope.Inf(n)
-        if p1.representsa('emptySet', tol) or p2.representsa('emptySet', tol):
+        if _aux_representsa(p1, 'emptySet', tol) or _aux_representsa(p2, 'emptySet', tol):
             return Polytope.empty(n)
-        if p1.representsa('origin', tol):
+        if _aux_representsa(p1, 'origin', tol):
             return p2
-        if p2.representsa('origin', tol):
+        if _aux_representsa(p2, 'origin', tol):
             return p1
         
         # Use the original representation flags for path determination
@@ -141,7 +159,7 @@ def plus(p1: Union['Polytope', np.ndarray], p2: Union['Polytope', np.ndarray]) -
         return _aux_setproperties(s_out, p1, p2)
     
     # Check fullspace for non-polytope p2
-    if p1.representsa('fullspace', tol) or (hasattr(p2, 'representsa') and p2.representsa('fullspace', tol)):
+    if _aux_representsa(p1, 'fullspace', tol) or (hasattr(p2, 'representsa') and p2.representsa('fullspace', tol)):
         return Polytope.Inf(n)
     
     if isinstance(p2, np.ndarray) and p2.ndim == 2 and p2.shape[1] == 1:
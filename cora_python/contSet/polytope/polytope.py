@@ -112,6 +112,11 @@ class Polytope(ContSet):
             self._bounded = P._bounded
             self._minHRep = P._minHRep
             self._minVRep = P._minVRep
+            # the bounding box is not copied: copies are often modified in
+            # place (e.g., by mtimes, minus), which would invalidate it
+            self._bbox = None
+            self._sparseCache = {}
+            self._representsaCache = {}
             return
 
         # 2. parse input arguments: varargin -> vars
@@ -140,6 +145,13 @@ class Polytope(ContSet):
         self._minHRep = minHRep
         self._minVRep = minVRep
 
+        # cached bounding box (lb, ub), see interval
+        self._bbox = None
+        # cached sparse copies of the constraint matrices, see contains_
+        self._sparseCache = {}
+        # cached results of the representsa checks in plus
+        self._representsaCache = {}
+
         # 5. set precedence (fixed)
         self.precedence = 80
 
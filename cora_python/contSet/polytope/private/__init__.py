@@ -13,6 +13,7 @@ Written: 2025
 """
 
 from .priv_supportFunc import priv_supportFunc
+from .priv_supportFunc_batch import priv_supportFunc_batch
 from .priv_normalize_constraints import priv_normalize_constraints
 from .priv_box_H import priv_box_H
 from .priv_box_V import priv_box_V
@@ -32,6 +33,7 @@ from .priv_vertices_1D import priv_vertices_1D
 
 __all__ = [
     "priv_supportFunc",
+    "priv_supportFunc_batch",
     "priv_normalize_constraints",
     "priv_box_H",
     "priv_box_V",
@@ -33,8 +33,7 @@ Python translation: 2025
 
 import numpy as np
 from typing import Tuple
-from cora_python.g.functions.matlab.init import unitvector
-from .priv_supportFunc import priv_supportFunc
+from .priv_supportFunc_batch import priv_supportFunc_batch
 
 
 def priv_box_H(A: np.ndarray, b: np.ndarray, Ae: np.ndarray, be: np.ndarray, 
@@ -57,27 +56,21 @@ def priv_box_H(A: np.ndarray, b: np.ndarray, Ae: np.ndarray, be: np.ndarray,
             empty - true/false whether result is the empty set
     """
     
-    # init bounds
-    ub = np.full((n, 1), np.inf)
-    lb = np.full((n, 1), -np.inf)
+    if Ae.size == 0 and A.size > 0 and np.all(np.count_nonzero(A, axis=1) <= 1):
+        # only axis-aligned inequality constraints: the bounds can be read
+        # off the constraints directly
+        ub, lb = _aux_bounds_axisAligned(A, b, n)
+    else:
+        # support functions in all 2n positive/negative basis vectors
+        val = priv_supportFunc_batch(A, b, Ae, be, np.hstack([np.eye(n), -np.eye(n)]), 'upper')
+        ub = val[:n].reshape(-1, 1)
+        lb = -val[n:].reshape(-1, 1)
     
-    # loop over all 2n positive/negative basis vectors
-    for i in range(n):
-        # i-th basis vector (using 0-based indexing)
-        e_i = unitvector(i + 1, n)  # unitvector uses 1-based indexing
-        
-        # maximize
-        ub_val, _ = priv_supportFunc(A, b, Ae, be, e_i, 'upper')
-        ub[i, 0] = ub_val
-        if ub[i, 0] == -np.inf:
-            empty = True
-            A_out = np.array([]).reshape(0, n)
-            b_out = np.array([]).reshape(0, 1)
-            return A_out, b_out, empty
-        
-        # minimize
-        lb_val, _ = priv_supportFunc(A, b, Ae, be, e_i, 'lower')
-        lb[i, 0] = lb_val
+    if np.any(ub == -np.inf):
+        empty = True
+        A_out = np.array([]).reshape(0, n)
+        b_out = np.array([]).reshape(0, 1)
+        return A_out, b_out, empty
     
     # construct output arguments
     A_out = np.vstack([np.eye(n), -np.eye(n)])
@@ -86,4 +79,30 @@ def priv_box_H(A: np.ndarray, b: np.ndarray, Ae: np.ndarray, be: np.ndarray,
     # emptiness
     empty = False
     
-    return A_out, b_out, empty 
\ No newline at end of file
+    return A_out, b_out, empty 
+
+
+def _aux_bounds_axisAligned(A: np.ndarray, b: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bounds of a polytope given by constraints with at most one non-zero
+    entry per row; as for the support function, an empty polytope is
+    signalled by an upper bound of -Inf
+    """
+    b = b.reshape(-1)
+    ub = np.full(n, np.inf)
+    lb = np.full(n, -np.inf)
+    
+    rows, cols = np.nonzero(A)
+    coeff = A[rows, cols]
+    bound = b[rows] / coeff
+    pos = coeff > 0
+    np.minimum.at(ub, cols[pos], bound[pos])
+    np.maximum.at(lb, cols[~pos], bound[~pos])
+    
+    # all-zero rows: 0 <= b must hold
+    zero_rows = np.ones(A.shape[0], dtype=bool)
+    zero_rows[rows] = False
+    if np.any(b[zero_rows] < 0) or np.any(lb > ub):
+        ub[:] = -np.inf
+    
+    return ub.reshape(-1, 1), lb.reshape(-1, 1)
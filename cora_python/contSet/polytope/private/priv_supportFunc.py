@@ -81,8 +81,7 @@ def priv_supportFunc(A: np.ndarray, b: np.ndarray, Ae: np.ndarray, be: np.ndarra
     }
     
     # solve linear program
-    x, val, exitflag = CORAlinprog(problem)
-    val = s * val
+    x, val, exitflag = CORAlinprog(problem)[:3]
     
     if exitflag == -3:
         # unbounded
@@ -94,5 +93,7 @@ def priv_supportFunc(A: np.ndarray, b: np.ndarray, Ae: np.ndarray, be: np.ndarra
         x = None
     elif exitflag != 1:
         raise CORAerror('CORA:solverIssue', 'Linear programming solver failed')
+    else:
+        val = s * val
     
     return val, x 
\ No newline at end of file
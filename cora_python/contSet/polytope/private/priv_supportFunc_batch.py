@@ -0,0 +1,97 @@
+"""
+priv_supportFunc_batch - computes the support function values of a polytope
+    for several directions by solving one linear program per direction in
+    a loop; the constraints are set up once and only the cost vector
+    changes, but there is no warm start between the linear programs
+
+Syntax:
+    val = priv_supportFunc_batch(A, b, Ae, be, dirs, type)
+
+Inputs:
+    A - inequality constraint matrix
+    b - inequality constraint offset
+    Ae - equality constraint matrix
+    be - equality constraint offset
+    dirs - directions (n x k matrix, one direction per column)
+    type - 'upper' or 'lower'
+
+Outputs:
+    val - values of the support function (k-element array); if the
+          polytope is empty, all values are s*Inf
+
+Other m-files required: none
+Subfunctions: none
+MAT-files required: none
+
+See also: priv_supportFunc
+
+Authors: Python implementation
+Written: 2025
+"""
+
+import numpy as np
+from cora_python.g.functions.matlab.converter import CORAlinprog
+from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
+
+
+def priv_supportFunc_batch(A: np.ndarray, b: np.ndarray, Ae: np.ndarray, be: np.ndarray,
+                           dirs: np.ndarray, type: str) -> np.ndarray:
+    """
+    Computes the support function values of a polytope for several directions,
+    one linear program per direction
+
+    Args:
+        A: Inequality constraint matrix
+        b: Inequality constraint offset
+        Ae: Equality constraint matrix
+        be: Equality constraint offset
+        dirs: Directions (n x k matrix, one direction per column)
+        type: 'upper' or 'lower'
+
+    Returns:
+        np.ndarray: values of the support function, one per direction
+    """
+
+    if type == 'upper':
+        s = -1
+    elif type == 'lower':
+        s = 1
+    else:
+        raise ValueError("type must be 'upper' or 'lower'")
+
+    num_dirs = dirs.shape[1]
+
+    # simple check: empty polytope (fullspace)
+    if A.size == 0 and Ae.size == 0:
+        return np.full(num_dirs, -s * np.inf)
+
+    # the constraints are converted once and shared by all linear programs;
+    # only the cost vector changes between directions
+    problem = {
+        'f': None,
+        'Aineq': np.asarray(A, dtype=float) if A.size > 0 else None,
+        'bineq': np.asarray(b, dtype=float).flatten() if A.size > 0 else None,
+        'Aeq': np.asarray(Ae, dtype=float) if Ae.size > 0 else None,
+        'beq': np.asarray(be, dtype=float).flatten() if Ae.size > 0 else None,
+        'lb': None,
+        'ub': None
+    }
+
+    val = np.empty(num_dirs)
+    for i in range(num_dirs):
+        problem['f'] = s * dirs[:, i]
+        _, val_i, exitflag = CORAlinprog(problem)[:3]
+
+        if exitflag == -3:
+            # unbounded
+            val[i] = -s * np.inf
+        elif exitflag == -2:
+            # infeasible -> empty set, same result for all directions
+            val[:] = s * np.inf
+            break
+        elif exitflag != 1:
+            raise CORAerror('CORA:solverIssue', 'Linear programming solver failed')
+        else:
+            val[i] = s * val_i
+
+    return val
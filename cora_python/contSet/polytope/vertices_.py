@@ -1,95 +1,79 @@
 import numpy as np
 from itertools import combinations
-from scipy.optimize import linprog
-import warnings
 from typing import TYPE_CHECKING
 
 from cora_python.g.functions.matlab.validate.check import withinTol
 from cora_python.contSet.polytope.private.priv_equalityToInequality import priv_equalityToInequality
-from .center import center
+from cora_python.contSet.polytope.private.priv_supportFunc_batch import priv_supportFunc_batch
 
 if TYPE_CHECKING:
     from cora_python.contSet.polytope.polytope import Polytope
 
-def vertices_(P: 'Polytope') -> np.ndarray:
+def vertices_(P: 'Polytope', method: str = 'lcon2vert', *args) -> np.ndarray:
     """
     Computes the vertices of a polytope.
     This is a Python translation of the 'lcon2vert' and 'comb' methods
-    from the MATLAB CORA library.
+    from the MATLAB CORA library. The vertices are stored in the polytope,
+    so that repeated calls return the same array without recomputation.
     """
-    tol = 1e-9
-
     if P._isVRep:
         return P._V
 
-    n = P.dim()
+    V = _aux_vertices(P)
+    P._V = V
+    P._isVRep = True
+    return V
 
-    # 1D case
-    if n == 1:
-        # Simplified 1D vertex calculation
-        V_list = []
-        if P._A is not None and P._b is not None:
-            for i in range(P._A.shape[0]):
-                if P._A[i, 0] != 0:
-                    V_list.append(P._b[i, 0] / P._A[i, 0])
-        if P._Ae is not None and P._be is not None:
-            for i in range(P._Ae.shape[0]):
-                if P._Ae[i, 0] != 0:
-                    V_list.append(P._be[i, 0] / P._Ae[i, 0])
-        
-        if not V_list:
-            return np.array([[]])
-
-        min_v, max_v = min(V_list), max(V_list)
-        
-        # HACK: contains is not fully robust yet for all cases
-        vertices = [v for v in [min_v, max_v]]
-        return np.array([vertices]) if vertices else np.array([[]])
-
-    # Check for emptiness/unboundedness using Chebyshev center
-    c, r = center(P)
-    if r < 0:
-        # Polytope is empty
+
+def _aux_vertices(P: 'Polytope') -> np.ndarray:
+    tol = 1e-9
+
+    n = P.dim()
+    A, b, Ae, be = _aux_constraints(P, n)
+
+    # check for emptiness/unboundedness via the support function in the
+    # directions of the unit vectors: the result also bounds all vertices
+    bounds = priv_supportFunc_batch(A, b, Ae, be,
+                                    np.hstack([np.eye(n), -np.eye(n)]), 'upper')
+    if np.any(bounds == -np.inf):
+        # polytope is empty
         return np.zeros((n, 0))
-    if np.isinf(r):
-        # Polytope is unbounded
+    if np.any(bounds == np.inf):
         raise ValueError("Cannot compute vertices for an unbounded polytope.")
 
-    # Combine all constraints into A_ineq*x <= b_ineq form
-    A_ineq, b_ineq = priv_equalityToInequality(P._A, P._b, P._Ae, P._be)
+    # 1D case: the vertices are the bounds
+    if n == 1:
+        lb, ub = -bounds[1], bounds[0]
+        if withinTol(lb, ub, tol):
+            return np.array([[ub]])
+        return np.array([[lb, ub]])
+
+    # combine all constraints into A_ineq*x <= b_ineq form
+    A_ineq, b_ineq = priv_equalityToInequality(A, b, Ae, be)
 
-    if A_ineq is None or A_ineq.shape[0] < n:
+    if A_ineq.shape[0] < n:
         return np.zeros((n, 0)) # Not enough constraints to define vertices
 
     # --- 'comb' method logic ---
-    # Iterate through all combinations of n constraints
+    # iterate through all combinations of n constraints; only linearly
+    # independent combinations intersect in a single point
     potential_vertices = []
-    
-    with warnings.catch_warnings():
-        warnings.filterwarnings('ignore', message='A_eq does not appear to be of full row rank. The dual solution may be inaccurate.')
-        for indices in combinations(range(A_ineq.shape[0]), n):
-            A_sub = A_ineq[list(indices), :]
-            b_sub = b_ineq[list(indices)]
-
-            # Solve A_sub * x = b_sub to find intersection point
-            try:
-                # Using direct solver first, fallback to pseudo-inverse
-                v = np.linalg.solve(A_sub, b_sub)
-                potential_vertices.append(v.flatten())
-            except np.linalg.LinAlgError:
-                # If singular, use pseudo-inverse
-                try:
-                    v = np.linalg.pinv(A_sub) @ b_sub
-                    potential_vertices.append(v.flatten())
-                except np.linalg.LinAlgError:
-                    # This combination of constraints is truly problematic
-                    continue
+    for indices in combinations(range(A_ineq.shape[0]), n):
+        A_sub = A_ineq[list(indices), :]
+        if np.linalg.matrix_rank(A_sub) < n:
+            continue
+        v = np.linalg.solve(A_sub, b_ineq[list(indices)])
+        potential_vertices.append(v.flatten())
 
     if not potential_vertices:
         return np.zeros((n, 0))
 
     # --- Filter vertices ---
-    # Check which potential vertices satisfy ALL constraints
+    # check which potential vertices satisfy ALL constraints; duplicates are
+    # detected relative to the extent of the polytope
+    scale = np.max(np.abs(bounds))
+    if scale == 0:
+        scale = 1.0
     valid_vertices = []
     unique_vertices_set = set()
 
@@ -97,7 +81,7 @@ def vertices_(P: 'Polytope') -> np.ndarray:
         v_col = v.reshape(-1, 1)
         if np.all(A_ineq @ v_col <= b_ineq + tol):
             # Check for uniqueness before adding
-            v_tuple = tuple(np.round(v, 6))
+            v_tuple = tuple(np.round(v / scale, 6))
             if v_tuple not in unique_vertices_set:
                 valid_vertices.append(v)
                 unique_vertices_set.add(v_tuple)
@@ -105,4 +89,16 @@ def vertices_(P: 'Polytope') -> np.ndarray:
     if not valid_vertices:
         return np.zeros((n, 0))
 
-    return np.array(valid_vertices).T 
\ No newline at end of file
+    return np.array(valid_vertices).T
+
+
+def _aux_constraints(P: 'Polytope', n: int):
+    # constraints as 2D arrays, using empty matrices for missing ones
+    A = P._A if P._A is not None else np.zeros((0, n))
+    b = P._b if P._b is not None else np.zeros((0, 1))
+    Ae = P._Ae if P._Ae is not None else np.zeros((0, n))
+    be = P._be if P._be is not None else np.zeros((0, 1))
+    return (np.asarray(A, dtype=float).reshape(-1, n),
+            np.asarray(b, dtype=float).reshape(-1, 1),
+            np.asarray(Ae, dtype=float).reshape(-1, n),
+            np.asarray(be, dtype=float).reshape(-1, 1))
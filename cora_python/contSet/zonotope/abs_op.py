@@ -28,8 +28,11 @@ def abs_op(Z: 'Zonotope') -> 'Zonotope':
     if Z.is_empty():
         return Zonotope.empty(Z.dim())
     
-    # Apply absolute value to center and generators
-    c_abs = np.abs(Z.c)
-    G_abs = np.abs(Z.G)
+    # Apply absolute value to center and generators, writing both into a
+    # single [c, G] buffer which the constructor splits into views
+    c, G = Z.c, Z.G
+    Z_abs = np.empty((c.shape[0], 1 + G.shape[1]), dtype=np.result_type(c, G))
+    np.abs(c, out=Z_abs[:, :1])
+    np.abs(G, out=Z_abs[:, 1:])
     
-    return Zonotope(c_abs, G_abs) 
\ No newline at end of file
+    return Zonotope(Z_abs)
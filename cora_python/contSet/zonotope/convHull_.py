@@ -57,21 +57,51 @@ def convHull_(Z: 'Zonotope', S: Optional[Union['ContSet', np.ndarray]] = None, m
     # Ensure that numeric is second input argument (reorder if necessary)
     Z_out, S = _reorder_numeric(Z, S)
     
+    # Dispatch on the exact type of the second operand
+    return _DISPATCH.get(type(S), _aux_convHull_set)(Z_out, S, method)
+
+
+def _aux_convHull_zono(Z: 'Zonotope', S: 'Zonotope', method: str) -> 'Zonotope':
+    """Convex hull of two zonotopes"""
+    if S.dim() != Z.dim():
+        raise CORAerror('CORA:dimensionMismatch',
+                      f'Dimension mismatch: {Z.dim()} vs {S.dim()}')
+    
+    # Convex hull with empty set
+    if S.representsa_('emptySet', 1e-15):
+        return Z
+    elif Z.representsa_('emptySet', 1e-15):
+        return S
+    
+    return Z.enclose(S)
+
+
+def _aux_convHull_numeric(Z: 'Zonotope', S: np.ndarray, method: str) -> 'Zonotope':
+    """Convex hull of a zonotope and a point"""
+    # Convex hull with empty set
+    if Z.representsa_('emptySet', 1e-15):
+        return Zonotope(S, np.array([]).reshape(len(S), 0))
+    
+    return Z.enclose(Zonotope(S))
+
+
+def _aux_convHull_set(Z: 'Zonotope', S, method: str) -> 'Zonotope':
+    """Convex hull of a zonotope and any other set or numeric type"""
     # Check dimensions
-    if hasattr(S, 'dim') and hasattr(Z_out, 'dim'):
-        if S.dim() != Z_out.dim():
+    if hasattr(S, 'dim') and hasattr(Z, 'dim'):
+        if S.dim() != Z.dim():
             raise CORAerror('CORA:dimensionMismatch',
-                          f'Dimension mismatch: {Z_out.dim()} vs {S.dim()}')
+                          f'Dimension mismatch: {Z.dim()} vs {S.dim()}')
     
     # Call function with lower precedence if applicable
-    if hasattr(S, 'precedence') and hasattr(Z_out, 'precedence') and S.precedence < Z_out.precedence:
-        return S.convHull(Z_out, method)
+    if hasattr(S, 'precedence') and hasattr(Z, 'precedence') and S.precedence < Z.precedence:
+        return S.convHull(Z, method)
     
     # Convex hull with empty set
     # Only check representsa_ for objects that have the necessary methods
-    if hasattr(S, '__class__') and hasattr(S, 'isemptyobject') and S.representsa_('emptySet', 1e-15):
-        return Z_out
-    elif Z_out.representsa_('emptySet', 1e-15):
+    if hasattr(S, 'isemptyobject') and S.representsa_('emptySet', 1e-15):
+        return Z
+    elif Z.representsa_('emptySet', 1e-15):
         return S if isinstance(S, Zonotope) else Zonotope(S, np.array([]).reshape(len(S), 0))
     
     # Use enclose method
@@ -81,7 +111,15 @@ def convHull_(Z: 'Zonotope', S: Optional[Union['ContSet', np.ndarray]] = None, m
         # Convert S to zonotope
         S_zono = Zonotope(S)
     
-    return Z_out.enclose(S_zono)
+    return Z.enclose(S_zono)
+
+
+# Handlers for the exact type of the second operand; all other types take
+# the generic path
+_DISPATCH = {
+    Zonotope: _aux_convHull_zono,
+    np.ndarray: _aux_convHull_numeric,
+}
 
 
 def _reorder_numeric(Z, S):
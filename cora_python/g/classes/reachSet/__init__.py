@@ -25,6 +25,8 @@ from .order import order
 from .plus import plus
 from .minus import minus
 from .shiftTime import shiftTime
+from .timeStepSize import timeStepSize
+from .updateTime import updateTime
 from .times import times
 from .mtimes import mtimes
 from .eq import eq
@@ -44,12 +46,14 @@ ReachSet.find = find
 ReachSet.project = project
 ReachSet.add = add
 ReachSet.append = append
-ReachSet.children = children
+ReachSet.children = staticmethod(children)
 ReachSet.contains = contains
 ReachSet.isequal = isequal
 ReachSet.isemptyobject = isemptyobject
 ReachSet.order = order
 ReachSet.shiftTime = shiftTime
+ReachSet.timeStepSize = timeStepSize
+ReachSet.updateTime = updateTime
 ReachSet.plot = plot
 ReachSet.plotOverTime = plotOverTime
 ReachSet.plotTimeStep = plotTimeStep
@@ -99,6 +103,8 @@ __all__ = [
     'plus',
     'minus',
     'shiftTime',
+    'timeStepSize',
+    'updateTime',
     'times',
     'mtimes',
     'eq',
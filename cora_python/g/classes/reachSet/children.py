@@ -35,11 +35,6 @@ def children(R_list: List['ReachSet'], parent: int) -> List[int]:
     Returns:
         List[int]: list of children node indices
     """
-    out = []
-    
-    for i in range(len(R_list)):
-        # Don't include the parent index itself, only its children
-        if i != parent and hasattr(R_list[i], 'parent') and R_list[i].parent == parent:
-            out.append(i)
-    
-    return out 
\ No newline at end of file
+    # Don't include the parent index itself, only its children
+    return [i for i, R in enumerate(R_list)
+            if i != parent and getattr(R, 'parent', None) == parent] 
\ No newline at end of file
@@ -11,12 +11,14 @@ Python translation: 2025
 """
 
 import numpy as np
-from typing import List, Tuple, Any, Union, Optional
+from collections import defaultdict
+from typing import Dict, List, Tuple, Any, Union, Optional
 import warnings
 
 
 def priv_incrementalMultiBranch(R: List, analyzer, i: int, t_final: float, 
-                              verbose: bool = False) -> Tuple['FourValuedResult', bool]:
+                              verbose: bool = False,
+                              child_index: Optional[Dict[int, List[int]]] = None) -> Tuple['FourValuedResult', bool]:
     """
     Incremental STL verification using a reachable set with multiple branches
     
@@ -26,6 +28,8 @@ def priv_incrementalMultiBranch(R: List, analyzer, i: int, t_final: float,
         i: Index of the current branch
         t_final: Final time step of R
         verbose: Whether to print additional information
+        child_index: Children of all branches (built on the first call and
+            passed on to the recursive calls)
         
     Returns:
         Tuple of (four-valued verdict for current branch, contagious flag)
@@ -34,8 +38,11 @@ def priv_incrementalMultiBranch(R: List, analyzer, i: int, t_final: float,
     # This is a simplified implementation
     warnings.warn("priv_incrementalMultiBranch is simplified - full framework needed")
     
-    # Get children of current branch
-    cs = _children(R, i)
+    # Get children of current branch; the parent -> children map is built
+    # once for the whole tree instead of scanning R for every branch
+    if child_index is None:
+        child_index = _aux_childIndex(R)
+    cs = child_index.get(i, [])
     
     if not cs:
         t_start_children = []
@@ -86,7 +93,8 @@ def priv_incrementalMultiBranch(R: List, analyzer, i: int, t_final: float,
         
         # We only need to look at the new branch if it started before we obtained a verdict
         if t_start <= t_stop:
-            branch_res, branch_cont = priv_incrementalMultiBranch(R, new_d, c, t_final, verbose)
+            branch_res, branch_cont = priv_incrementalMultiBranch(R, new_d, c, t_final, verbose,
+                                                                  child_index)
             res = _aux_combine_results(res, branch_res, contagious, branch_cont)
             contagious = contagious or branch_cont
         elif verbose:
@@ -95,14 +103,14 @@ def priv_incrementalMultiBranch(R: List, analyzer, i: int, t_final: float,
     return res, contagious
 
 
-def _children(R: List, i: int) -> List[int]:
-    """Get children of branch i (simplified)"""
-    # This is a simplified implementation
-    children = []
+def _aux_childIndex(R: List) -> Dict[int, List[int]]:
+    """Map each branch index to the indices of its children"""
+    index = defaultdict(list)
     for j, reach_set in enumerate(R):
-        if j != i and reach_set.parent == i:
-            children.append(j)
-    return children
+        parent = getattr(reach_set, 'parent', None)
+        if parent is not None and parent != j:
+            index[parent].append(j)
+    return index
 
 
 def _aux_single_branch(R, analyzer, t_start_children: List[float]) -> Tuple['FourValuedResult', float, List]:
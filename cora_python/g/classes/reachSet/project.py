@@ -57,22 +57,17 @@ def project(R, dims: List[int]):
         if dim < 0:
             raise ValueError("Dimension indices must be non-negative")
     
+    dims_idx = np.asarray(dims, dtype=np.intp)
+    
+    # set objects that occur several times (e.g., shared between time-point
+    # and time-interval sets) are projected only once; keyed by id, which is
+    # stable since R holds references to all sets during this call
+    memo = {}
+    
     # Project time-point sets
     projected_timePoint = {}
     if 'set' in R.timePoint:
-        projected_timePoint['set'] = []
-        for s in R.timePoint['set']:
-            if hasattr(s, 'project'):
-                projected_timePoint['set'].append(s.project(dims))
-            else:
-                # For numeric arrays, just select dimensions
-                if isinstance(s, np.ndarray):
-                    if s.ndim == 1:
-                        projected_timePoint['set'].append(s[dims])
-                    else:
-                        projected_timePoint['set'].append(s[dims, :])
-                else:
-                    projected_timePoint['set'].append(s)
+        projected_timePoint['set'] = _aux_projectSets(R.timePoint['set'], dims, dims_idx, memo)
         
         # Copy other fields
         for key in ['time', 'error']:
@@ -82,23 +77,63 @@ def project(R, dims: List[int]):
     # Project time-interval sets
     projected_timeInterval = {}
     if 'set' in R.timeInterval:
-        projected_timeInterval['set'] = []
-        for s in R.timeInterval['set']:
-            if hasattr(s, 'project'):
-                projected_timeInterval['set'].append(s.project(dims))
-            else:
-                # For numeric arrays, just select dimensions
-                if isinstance(s, np.ndarray):
-                    if s.ndim == 1:
-                        projected_timeInterval['set'].append(s[dims])
-                    else:
-                        projected_timeInterval['set'].append(s[dims, :])
-                else:
-                    projected_timeInterval['set'].append(s)
+        projected_timeInterval['set'] = _aux_projectSets(R.timeInterval['set'], dims, dims_idx, memo)
         
         # Copy other fields
         for key in ['time', 'error', 'algebraic']:
             if key in R.timeInterval:
                 projected_timeInterval[key] = R.timeInterval[key].copy()
     
-    return ReachSet(projected_timePoint, projected_timeInterval, R.parent, R.loc) 
\ No newline at end of file
+    return ReachSet(projected_timePoint, projected_timeInterval, R.parent, R.loc) 
+
+
+# Auxiliary functions -----------------------------------------------------
+
+def _aux_projectSets(sets, dims, dims_idx, memo):
+    """
+    Projects a list of sets; the projections of numeric arrays of equal
+    shape share one output array, and set objects already contained in memo
+    are not projected again
+    """
+    # homogeneous sets (the common case): resolve the method once
+    if sets:
+        set_type = type(sets[0])
+        proj = getattr(set_type, 'project', None)
+        if proj is not None and all(type(s) is set_type for s in sets):
+            return [_aux_projectSet(s, dims, memo, proj) for s in sets]
+    
+    projected = list(sets)
+    
+    # group the numeric entries by shape and data type; the project method
+    # is resolved once per type, other entries are kept unchanged
+    methods = {}
+    groups = {}
+    for i, s in enumerate(sets):
+        set_type = type(s)
+        if set_type not in methods:
+            methods[set_type] = getattr(set_type, 'project', None)
+        if methods[set_type] is not None:
+            projected[i] = _aux_projectSet(s, dims, memo, methods[set_type])
+        elif isinstance(s, np.ndarray):
+            groups.setdefault((s.shape, s.dtype), []).append(i)
+    
+    # the selected rows of all entries of a group are gathered into one
+    # preallocated array, so the full entries are never copied
+    for (shape, dtype), idx in groups.items():
+        selected = np.empty((len(idx), len(dims_idx)) + shape[1:], dtype=dtype)
+        for k, i in enumerate(idx):
+            np.take(sets[i], dims_idx, axis=0, out=selected[k])
+            projected[i] = selected[k]
+    
+    return projected
+
+
+def _aux_projectSet(S, dims, memo, proj):
+    """
+    Projects a single set object using the unbound method proj, reusing
+    the result for repeated objects
+    """
+    key = id(S)
+    if key not in memo:
+        memo[key] = proj(S, dims)
+    return memo[key]
@@ -72,17 +72,13 @@ def monitorSTL(simRes: 'SimResult', eq: Any) -> bool:
             simRes_i = simRes_list[i]
             
             # Check if simulation has valid data
-            if not simRes_i.x or not simRes_i.t:
+            if not simRes_i.x or not simRes_i.t or len(simRes_i.x) != len(simRes_i.t):
                 return False
-                
-            for j in range(len(simRes_i.t)):
-                # Basic checks on trajectory data
-                if len(simRes_i.t[j]) == 0 or len(simRes_i.x[j]) == 0:
-                    return False
-                    
-                # Check time consistency
-                if simRes_i.t[j][-1] <= simRes_i.t[j][0]:
-                    return False
+        
+        # the trajectories of all simulation results are checked together
+        if not _aux_validTrajectories([t for simRes_i in simRes_list for t in simRes_i.t],
+                                      [x for simRes_i in simRes_list for x in simRes_i.x]):
+            return False
         
         # If we reach here, basic validation passed
         # In a full implementation, this would evaluate the STL formula
@@ -95,4 +91,28 @@ def monitorSTL(simRes: 'SimResult', eq: Any) -> bool:
         
     except Exception as e:
         print(f"Error in monitorSTL: {e}")
-        return False 
\ No newline at end of file
+        return False 
+
+
+# Auxiliary functions -----------------------------------------------------
+
+def _aux_validTrajectories(t: list, x: list) -> bool:
+    """
+    Basic checks on all trajectories of a simulation result at once:
+    non-empty data and increasing time; only the first and last time
+    point of each trajectory are gathered, so no trajectory is copied
+    """
+    num_traj = len(t)
+    if len(x) != num_traj:
+        return False
+    
+    # check for empty trajectories
+    len_t = np.fromiter(map(len, t), dtype=np.int64, count=num_traj)
+    len_x = np.fromiter(map(len, x), dtype=np.int64, count=num_traj)
+    if num_traj == 0 or len_t.min() == 0 or len_x.min() == 0:
+        return False
+    
+    # check time consistency
+    t_start = np.fromiter((np.ravel(t_j)[0] for t_j in t), dtype=np.float64, count=num_traj)
+    t_end = np.fromiter((np.ravel(t_j)[-1] for t_j in t), dtype=np.float64, count=num_traj)
+    return bool(np.all(t_end > t_start))
@@ -35,23 +35,70 @@ def times(simRes1, simRes2):
     
     # If simRes1 is numeric and simRes2 is simResult (reverse multiplication)
     if isinstance(simRes1, (int, float, np.ndarray)) and hasattr(simRes2, 'x'):
-        new_x = [x * simRes1 for x in simRes2.x]
-        new_y = [y * simRes1 for y in simRes2.y] if simRes2.y else []
-        new_a = [a * simRes1 for a in simRes2.a] if simRes2.a else []
-        
-        return SimResult(new_x, simRes2.t.copy(), simRes2.loc, new_y, new_a)
+        simRes1, simRes2 = simRes2, simRes1
     
     # If simRes2 is numeric, multiply all states element-wise
-    elif isinstance(simRes2, (int, float, np.ndarray)):
-        new_x = [x * simRes2 for x in simRes1.x]
-        new_y = [y * simRes2 for y in simRes1.y] if simRes1.y else []
-        new_a = [a * simRes2 for a in simRes1.a] if simRes1.a else []
+    if isinstance(simRes2, (int, float, np.ndarray)):
+        fused = _aux_scaleFused(simRes1, simRes2) if np.ndim(simRes2) == 0 else None
+        if fused is not None:
+            new_x, new_y, new_a = fused
+        else:
+            new_x = _aux_scaleTrajectories(simRes1.x, simRes2)
+            new_y = _aux_scaleTrajectories(simRes1.y, simRes2) if simRes1.y else []
+            new_a = _aux_scaleTrajectories(simRes1.a, simRes2) if simRes1.a else []
         
-        return SimResult(new_x, simRes1.t.copy(), simRes1.loc, new_y, new_a)
+        # the time points are not modified, only the list is copied
+        return SimResult(new_x, list(simRes1.t), simRes1.loc, new_y, new_a)
     
     # If simRes2 is another simResult, this is more complex (not commonly used)
     elif hasattr(simRes2, 'x') and hasattr(simRes2, 't'):
         raise NotImplementedError("Element-wise multiplication between simResult objects not implemented")
     
     else:
-        raise TypeError(f"Unsupported operand type for .*: simResult and {type(simRes2)}") 
\ No newline at end of file
+        raise TypeError(f"Unsupported operand type for .*: simResult and {type(simRes2)}") 
+
+
+# Auxiliary functions -----------------------------------------------------
+
+def _aux_scaleTrajectories(trajs, factor):
+    """
+    Multiplies all trajectories by factor; trajectories of equal shape are
+    stacked so that a single multiplication is performed
+    """
+    if len(trajs) > 1 and len({np.shape(traj) for traj in trajs}) == 1:
+        return list(np.stack(trajs) * factor)
+    return [traj * factor for traj in trajs]
+
+
+def _aux_scaleFused(simRes, factor):
+    """
+    Multiplies states, outputs, and algebraic variables by a scalar factor
+    in one pass over a single buffer; requires that all trajectories have
+    the same number of time steps and each field has a uniform shape,
+    otherwise None is returned
+    """
+    fields = [simRes.x, simRes.y, simRes.a]
+    present = [field for field in fields if field]
+    if len(present) < 2:
+        return None
+    shapes = [{np.shape(traj) for traj in field} for field in present]
+    if any(len(shape) != 1 for shape in shapes):
+        return None
+    shapes = [shape.pop() for shape in shapes]
+    if any(len(shape) != 2 for shape in shapes) or len({shape[0] for shape in shapes}) != 1:
+        return None
+    
+    # copy all fields side by side into one buffer, then scale in place
+    dtype = np.result_type(*[field[0] for field in present], factor)
+    combined = np.empty((len(present[0]), shapes[0][0], sum(shape[1] for shape in shapes)), dtype=dtype)
+    views = []
+    col = 0
+    for field, shape in zip(present, shapes):
+        view = combined[:, :, col:col + shape[1]]
+        np.stack(field, out=view)
+        views.append(view)
+        col += shape[1]
+    np.multiply(combined, factor, out=combined)
+    
+    views = iter(views)
+    return [list(next(views)) if field else [] for field in fields]
@@ -59,29 +59,36 @@ class CORAerror(Exception):
     
     def _get_caller_info(self):
         """Get information about the calling function"""
+        frame = None
         try:
-            # Get the call stack
-            stack = inspect.stack()
+            # Walk the raw frame chain; inspect.stack() would additionally read
+            # the source context of every frame, which dominates construction
+            frame = inspect.currentframe()
+            frame = frame.f_back if frame is not None else None
             
             # Find the first frame that's not in this file
-            for frame_info in stack[1:]:
-                if 'CORAerror.py' not in frame_info.filename:
-                    filename = frame_info.filename.split('/')[-1].split('\\')[-1]
+            while frame is not None:
+                code = frame.f_code
+                if 'CORAerror.py' not in code.co_filename:
+                    filename = code.co_filename.split('/')[-1].split('\\')[-1]
                     if filename.endswith('.py'):
                         filename = filename[:-3]
                     
-                    functionname = frame_info.function
+                    functionname = code.co_name
                     
                     # Try to determine class name from the frame
                     classname = functionname
-                    if 'self' in frame_info.frame.f_locals:
-                        classname = frame_info.frame.f_locals['self'].__class__.__name__
+                    if 'self' in frame.f_locals:
+                        classname = frame.f_locals['self'].__class__.__name__
                     
                     return filename, classname, functionname
+                frame = frame.f_back
             
             return 'unknown', 'unknown', 'unknown'
         except:
             return 'unknown', 'unknown', 'unknown'
+        finally:
+            del frame
     
     def _generate_error_message(self) -> str:
         """Generate error message based on identifier"""
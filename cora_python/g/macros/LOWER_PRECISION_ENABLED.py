@@ -0,0 +1,12 @@
+def LOWER_PRECISION_ENABLED():
+    """
+    LOWER_PRECISION_ENABLED - macro to allow numerical kernels to keep the
+    precision of single-precision (float32) inputs instead of promoting
+    them to double precision; this halves the memory traffic of large
+    matrix products, but results may differ from the double-precision
+    computation within single-precision round-off
+
+    Returns:
+        bool: True if lower precision is allowed, False otherwise.
+    """
+    return False
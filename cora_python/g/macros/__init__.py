@@ -12,6 +12,7 @@ from .CHECKS_ENABLED import CHECKS_ENABLED
 from .CORAGITBRANCH import CORAGITBRANCH
 from .CORAROOT import CORAROOT
 from .VALIDATEOPTIONS_ERRORS import VALIDATEOPTIONS_ERRORS
+from .LOWER_PRECISION_ENABLED import LOWER_PRECISION_ENABLED
 
 __all__ = [
     'CORAVERSION',
@@ -20,7 +21,8 @@ __all__ = [
     'CHECKS_ENABLED',
     'CORAGITBRANCH',
     'CORAROOT',
-    'VALIDATEOPTIONS_ERRORS'
+    'VALIDATEOPTIONS_ERRORS',
+    'LOWER_PRECISION_ENABLED'
 ]
 
 # Global flag to enable/disable input argument checking
@@ -47,15 +47,8 @@ def splitLogic(spec) -> Tuple[List, List]:
     else:
         spec_list = spec
     
-    spec_non_logic = []
-    spec_logic = []
+    # partition in a single pass each, keeping the original order
+    spec_logic = [s for s in spec_list if s.type == 'logic']
+    spec_non_logic = [s for s in spec_list if s.type != 'logic']
     
-    for s in spec_list:
-        if s.type == 'logic':
-            # Temporal logic specifications
-            spec_logic = s.add(spec_logic)
-        else:
-            # Non-temporal logic specifications
-            spec_non_logic = s.add(spec_non_logic)
-    
-    return spec_non_logic, spec_logic 
\ No newline at end of file
+    return spec_non_logic, spec_logic
@@ -159,10 +159,29 @@ def test_linearSys_input_validation():
         LinearSys(A, B)
 
 
+def test_linearSys_scalar_matrices():
+    """Test that scalar B, E, F are stored as dense scaled identities"""
+    from cora_python.contSet.polytope import Polytope
+    
+    A = np.array([[-1, 0], [1, -2]])
+    sys = LinearSys(A, 2.0, np.zeros(2), np.eye(2), 0, np.zeros(2), 0.5, 3.0)
+    
+    for M, scalar in ((sys.B, 2.0), (sys.E, 0.5), (sys.F, 3.0)):
+        assert isinstance(M, np.ndarray)
+        assert np.array_equal(M, scalar * np.eye(2))
+    assert sys.nr_of_inputs == 2
+    assert sys.B.size > 0 and sys.E.size > 0
+    
+    # the scaled identity can be applied to sets
+    P = Polytope(np.array([[1, 0], [-1, 0], [0, 1], [0, -1]]), np.ones(4))
+    assert (sys.B @ P).contains_(np.array([[2], [2]]), 'exact', 1e-9, 0, False, False)[0]
+
+
 if __name__ == "__main__":
     test_linearSys_constructor()
     test_linearSys_with_name()
     test_linearSys_equality()
     test_linearSys_display()
     test_linearSys_input_validation()
-    print("All tests passed!") 
\ No newline at end of file
+    test_linearSys_scalar_matrices()
+    print("All tests passed!") 
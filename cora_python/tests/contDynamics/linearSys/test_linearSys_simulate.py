@@ -375,5 +375,18 @@ def test_simulate_function_directly():
     assert np.allclose(x[0, :], params['x0']), "Initial condition should match"
 
 
+def test_simulate_scalar_input_matrix():
+    """Test that a scalar input matrix simulates like the identity matrix"""
+    A = np.array([[-1, 0.5], [0, -2]])
+    u = np.array([[1], [-0.5]])
+    params = {'x0': np.array([1, 1]), 'u': u, 'tFinal': 1, 'timeStep': 0.1}
+    
+    t1, x1, _, _ = LinearSys(A, 2.0).simulate(params)
+    t2, x2, _, _ = LinearSys(A, 2.0 * np.eye(2)).simulate(params)
+    
+    assert np.allclose(t1, t2)
+    assert np.allclose(x1, x2)
+
+
 if __name__ == '__main__':
     pytest.main([__file__]) 
\ No newline at end of file
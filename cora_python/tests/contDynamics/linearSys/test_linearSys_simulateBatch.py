@@ -0,0 +1,78 @@
+"""
+test_linearSys_simulateBatch - unit test function for batched simulation
+
+Tests the simulateBatch method for linearSys objects against the closed-form
+solution and the step-by-step recursion.
+
+Syntax:
+    pytest cora_python/tests/contDynamics/linearSys/test_linearSys_simulateBatch.py
+
+Authors: Python implementation
+Date: 2025
+"""
+
+import pytest
+import numpy as np
+from scipy.linalg import expm
+from cora_python.contDynamics.linearSys.linearSys import LinearSys
+
+
+class TestLinearSysSimulateBatch:
+    def test_simulateBatch_autonomous(self):
+        """Without inputs, the states follow expm(A*t) @ x0"""
+        A = np.array([[-1, -4], [4, -1]])
+        sys = LinearSys(A, np.zeros((2, 1)))
+        X0 = np.array([[1.0, 0.0, -2.0], [0.0, 1.0, 0.5]])
+        U = np.zeros((10, 1, 3))
+
+        X = sys.simulateBatch(X0, U, 0.1)
+
+        assert X.shape == (11, 2, 3)
+        assert np.allclose(X[0], X0)
+        assert np.allclose(X[-1], expm(A * 1.0) @ X0)
+
+    def test_simulateBatch_inputs_and_offset(self):
+        """Inputs and offset match a per-sample step-by-step recursion"""
+        A = np.array([[0.0, 1.0], [-2.0, -0.5]])
+        B = np.array([[0.0], [1.0]])
+        c = np.array([0.1, -0.2])
+        sys = LinearSys(A, B, c)
+        dt = 0.05
+        rng = np.random.default_rng(0)
+        X0 = rng.standard_normal((2, 4))
+        U = rng.standard_normal((20, 1, 4))
+
+        X = sys.simulateBatch(X0, U, dt)
+
+        # reference: x' = Ax + Bu + c with u constant, i.e. an autonomous
+        # system with the constant inhomogeneity appended as extra state
+        M = np.zeros((3, 3))
+        M[:2, :2] = A
+        x = X0.copy()
+        for k in range(U.shape[0]):
+            for s in range(X0.shape[1]):
+                M[:2, 2] = B[:, 0] * U[k, 0, s] + c
+                x[:, s] = (expm(M * dt) @ np.append(x[:, s], 1.0))[:2]
+            assert np.allclose(X[k + 1], x)
+
+    def test_simulateBatch_shared_input(self):
+        """A 2D input trajectory is shared by all samples"""
+        sys = LinearSys(np.array([[-1.0]]), np.array([[1.0]]))
+        U = np.ones((5, 1))
+
+        X = sys.simulateBatch(np.array([[0.0, 1.0]]), U, 0.2)
+
+        # x(t) = 1 + (x0 - 1) * exp(-t) for u = 1
+        assert np.allclose(X[-1], 1 + (np.array([[0.0, 1.0]]) - 1) * np.exp(-1.0))
+
+    def test_simulateBatch_wrong_dimensions(self):
+        """Dimension mismatches are reported"""
+        sys = LinearSys(np.eye(2), np.ones((2, 1)))
+        with pytest.raises(ValueError):
+            sys.simulateBatch(np.zeros((3, 1)), np.zeros((2, 1, 1)), 0.1)
+        with pytest.raises(ValueError):
+            sys.simulateBatch(np.zeros((2, 1)), np.zeros((2, 2, 1)), 0.1)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
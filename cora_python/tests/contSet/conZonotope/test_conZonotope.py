@@ -134,6 +134,29 @@ class TestConZonotope:
         cZ_empty0 = ConZonotope.empty(0)
         assert cZ_empty0.dim() == 0
     
+    def test_empty_conZonotope_writable(self):
+        """Test that empty ConZonotopes can be modified in place"""
+        cZ = ConZonotope.empty(2)
+        cZ.c += 1
+        cZ.c[0, 0] = 5
+        assert np.array_equal(cZ.c, np.array([[5], [1]]))
+
+        # other instances are not affected
+        cZ2 = ConZonotope.empty(2)
+        assert np.array_equal(cZ2.c, np.zeros((2, 1)))
+        for attr in ('c', 'G', 'A', 'b', 'ksi', 'R'):
+            assert getattr(cZ, attr) is not getattr(cZ2, attr)
+
+    def test_constructor_copy_independent(self):
+        """Test that a copy does not share arrays with the original"""
+        cZ = ConZonotope(np.array([1, 2]), np.array([[1, 0], [0, 1]]),
+                         np.array([[1, 1]]), np.array([0.5]))
+        cZ_copy = ConZonotope(cZ)
+        for attr in ('c', 'G', 'A', 'b'):
+            getattr(cZ_copy, attr).flat[0] = 5
+        assert cZ.c.flat[0] == 1 and cZ.G.flat[0] == 1
+        assert cZ.A.flat[0] == 1 and cZ.b.flat[0] == 0.5
+
     def test_origin_conZonotope(self):
         """Test origin ConZonotope creation"""
         cZ_origin = ConZonotope.origin(3)
@@ -139,5 +139,14 @@ class TestCompact:
             compact(S)
 
 
+    def test_compact_dispatch(self):
+        """Test that the base compact_ passes the set to the subclass"""
+        from cora_python.contSet.contSet.compact_ import compact_
+        from cora_python.contSet.zonotope import Zonotope
+        Z = Zonotope(np.zeros((2, 1)), np.array([[1, 0, 0], [0, 1, 0]]))
+        res = compact_(Z, 'zeros', 1e-10)
+        assert isinstance(res, Zonotope)
+        assert np.allclose(res.G, np.eye(2))
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -150,5 +150,15 @@ class TestContains:
         assert isinstance(result, bool)
 
 
+    def test_contains_dispatch(self):
+        """Test that the base contains_ passes the set to the subclass"""
+        from cora_python.contSet.contSet.contains_ import contains_
+        from cora_python.contSet.interval import Interval
+        I = Interval(-np.ones((2, 1)), np.ones((2, 1)))
+        res, _, _ = contains_(I, np.array([[0.5], [0.5]]))
+        assert res
+        res, _, _ = contains_(I, np.array([[2], [0]]))
+        assert not res
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
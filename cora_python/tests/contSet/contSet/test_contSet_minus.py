@@ -0,0 +1,54 @@
+"""
+test_minus - unit test function for minus
+
+Syntax:
+    pytest test_contSet_minus.py
+
+Inputs:
+    -
+
+Outputs:
+    test results
+
+Other modules required: none
+Subfunctions: none
+
+See also: none
+
+Authors: AI Assistant
+Written: 2025
+Last update: ---
+Last revision: ---
+"""
+
+import numpy as np
+
+from cora_python.contSet.contSet.minus import minus
+from cora_python.contSet.emptySet import EmptySet
+from cora_python.contSet.zonotope import Zonotope
+
+
+def test_minus_zero_vector():
+    # translation by the origin returns the set itself
+    Z = Zonotope(np.array([[1.0], [0.0]]), np.eye(2))
+    assert minus(Z, np.zeros((2, 1))) is Z
+    assert minus(Z, np.zeros(2)) is Z
+    assert minus(Z, 0) is Z
+
+
+def test_minus_vector():
+    Z = Zonotope(np.array([[1.0], [0.0]]), np.eye(2))
+    res = minus(Z, np.array([[0.5], [-1.0]]))
+    assert np.allclose(res.c, np.array([[0.5], [1.0]]))
+    assert np.allclose(res.G, np.eye(2))
+
+
+def test_minus_0d_array():
+    # a 0-dimensional array is treated as a scalar
+    Z = Zonotope(np.array([[1.0]]), np.array([[1.0]]))
+    assert np.allclose(minus(Z, np.array(0.5)).c, np.array([[0.5]]))
+    assert np.allclose(minus(Z, np.array(0.0)).c, np.array([[1.0]]))
+
+    res = minus(EmptySet(1), np.array(0.5))
+    assert isinstance(res, EmptySet)
+    assert res.dim() == 1
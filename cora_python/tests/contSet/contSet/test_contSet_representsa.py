@@ -222,5 +222,24 @@ class TestRepresentsa:
             representsa(S, 'INTERVAL')  # Not in admissible list
 
 
+    def test_representsa_dispatch(self):
+        """Test that the base representsa_ passes the set to the subclass"""
+        from cora_python.contSet.contSet.representsa_ import representsa_
+        from cora_python.contSet.zonotope import Zonotope
+        from cora_python.contSet.interval import Interval
+        Z = Zonotope(np.zeros((2, 1)), np.zeros((2, 1)))
+        assert representsa_(Z, 'origin')
+        assert not representsa_(Zonotope(np.zeros((2, 1)), np.eye(2)), 'origin')
+        # subclass without method, iter, and splits arguments
+        I = Interval(np.zeros((2, 1)), np.zeros((2, 1)))
+        assert representsa_(I, 'origin')
+
+        # errors raised inside the subclass are not swallowed
+        class FailingSet:
+            def representsa_(self, set_type, tol, method, iter_val, splits):
+                raise TypeError('bad operand')
+        with pytest.raises(TypeError, match='bad operand'):
+            representsa_(FailingSet(), 'origin')
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -23,6 +23,7 @@ Last revision: ---
 
 import pytest
 import numpy as np
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from cora_python.contSet.contSet.representsa_emptyObject import representsa_emptyObject
 
@@ -30,11 +31,22 @@ from cora_python.contSet.contSet.representsa_emptyObject import representsa_empt
 class MockContSet:
     """Mock ContSet for testing representsa_emptyObject method"""
     
+    __slots__ = ('_class_name', '_dim', '_empty', 'isHRep', 'isVRep', 'b', 'be', 'V')
+    
     def __init__(self, class_name="Zonotope", dim_val=2, empty=False, special_props=None):
         self._class_name = class_name
         self._dim = dim_val
         self._empty = empty
-        self._special_props = special_props or {}
+        special_props = special_props or {}
+        
+        # Mock polytope properties for testing, set once as plain attributes
+        self.isHRep = SimpleNamespace(val=special_props['isHRep']) \
+            if 'isHRep' in special_props else None
+        self.isVRep = SimpleNamespace(val=special_props['isVRep']) \
+            if 'isVRep' in special_props else None
+        self.b = special_props.get('b', None)
+        self.be = special_props.get('be', None)
+        self.V = special_props.get('V', None)
         
     def __class__(self):
         class MockClass:
@@ -46,35 +58,6 @@ class MockContSet:
     
     def isemptyobject(self):
         return self._empty
-    
-    # Mock polytope properties for testing
-    @property
-    def isHRep(self):
-        if 'isHRep' in self._special_props:
-            class Rep:
-                val = self._special_props['isHRep']
-            return Rep()
-        return None
-    
-    @property
-    def isVRep(self):
-        if 'isVRep' in self._special_props:
-            class Rep:
-                val = self._special_props['isVRep']
-            return Rep()
-        return None
-    
-    @property
-    def b(self):
-        return self._special_props.get('b', None)
-    
-    @property
-    def be(self):
-        return self._special_props.get('be', None)
-    
-    @property
-    def V(self):
-        return self._special_props.get('V', None)
 
 
 # Mock set classes for testing
@@ -154,5 +154,25 @@ class TestSupportFunc:
         assert not np.isclose(result_pos, result_neg)
 
 
+    def test_supportFunc_dispatch(self):
+        """Test that the base supportFunc_ passes the set to the subclass"""
+        from cora_python.contSet.contSet.supportFunc_ import supportFunc_
+        from cora_python.contSet.zonotope import Zonotope
+        from cora_python.contSet.ellipsoid import Ellipsoid
+        Z = Zonotope(np.array([[1], [0]]), np.eye(2))
+        val = supportFunc_(Z, np.array([[1], [0]]), 'upper')[0]
+        assert np.isclose(val, 2)
+        # subclass without method, order/splits, and tolerance arguments
+        E = Ellipsoid(np.eye(2))
+        val = supportFunc_(E, np.array([[1], [0]]), 'upper')[0]
+        assert np.isclose(val, 1)
+
+        # errors raised inside the subclass are not swallowed
+        class FailingSet:
+            def supportFunc_(self, direction, type_, method, order, tol):
+                raise TypeError('bad operand')
+        with pytest.raises(TypeError, match='bad operand'):
+            supportFunc_(FailingSet(), np.array([[1], [0]]), 'upper')
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -0,0 +1,61 @@
+import numpy as np
+from cora_python.contSet.polytope.private.priv_box_H import priv_box_H
+
+def test_priv_box_H():
+    A_box = np.vstack([np.eye(2), -np.eye(2)])
+    Ae = np.zeros((0, 2))
+    be = np.zeros((0, 1))
+
+    # Test case 1: axis-aligned constraints, including redundant ones
+    A = np.array([[1., 0.], [-2., 0.], [0., 3.], [0., -1.], [1., 0.]])
+    b = np.array([[1.], [2.], [3.], [4.], [0.5]])
+    A_res, b_res, empty = priv_box_H(A, b, Ae, be, 2)
+    assert not empty
+    assert np.allclose(A_res, A_box)
+    assert np.allclose(b_res, np.array([[0.5], [1.], [1.], [4.]]))
+
+    # Test case 2: general constraints (triangle)
+    A = np.array([[1., 1.], [-1., 0.], [0., -1.]])
+    b = np.array([[1.], [0.], [0.]])
+    A_res, b_res, empty = priv_box_H(A, b, Ae, be, 2)
+    assert not empty
+    assert np.allclose(b_res, np.array([[1.], [1.], [0.], [0.]]))
+
+    # Test case 3: equality constraints
+    A = np.array([[1., 0.], [-1., 0.]])
+    b = np.array([[0.5], [1.]])
+    A_res, b_res, empty = priv_box_H(A, b, np.array([[1., 1.]]), np.array([[0.]]), 2)
+    assert not empty
+    assert np.allclose(b_res, np.array([[0.5], [1.], [1.], [0.5]]))
+
+    # Test case 4: empty polytopes, axis-aligned and general
+    A = np.array([[1., 0.], [-1., 0.]])
+    b = np.array([[-1.], [0.]])
+    A_res, b_res, empty = priv_box_H(A, b, Ae, be, 2)
+    assert empty
+    assert A_res.shape == (0, 2) and b_res.shape == (0, 1)
+
+    A = np.array([[1., 1.], [-1., -1.]])
+    A_res, b_res, empty = priv_box_H(A, b, Ae, be, 2)
+    assert empty
+
+
+def test_priv_box_H_supportFunc():
+    # non-axis-aligned constraints: the box must agree with the support
+    # function evaluated separately in every basis direction
+    from cora_python.contSet.polytope.private.priv_supportFunc import priv_supportFunc
+
+    np.random.seed(1)
+    n = 3
+    A = np.vstack([np.random.randn(8, n), np.ones((1, n)), -np.eye(n)])
+    b = np.ones((A.shape[0], 1))
+    cases = [(A, b, np.zeros((0, n)), np.zeros((0, 1))),
+             (A, b, np.array([[1., -1., 2.]]), np.array([[0.25]]))]
+
+    for A, b, Ae, be in cases:
+        A_res, b_res, empty = priv_box_H(A, b, Ae, be, n)
+        assert not empty
+        assert np.allclose(A_res, np.vstack([np.eye(n), -np.eye(n)]))
+        for i in range(2 * n):
+            val = priv_supportFunc(A, b, Ae, be, A_res[i, :].reshape(-1, 1), 'upper')[0]
+            assert np.isclose(b_res[i, 0], val)
@@ -4,69 +4,72 @@
 
 import numpy as np
 import pytest
-from cora_python.contSet.polytope.polytope import Polytope
 from cora_python.contSet.polytope.origin import origin
 from cora_python.g.functions.matlab.validate.postprocessing.CORAerror import CORAerror
 
 
+@pytest.fixture(scope="module", params=[1, 2, 3, 4, 5])
+def origin_poly(request):
+    # origin polytope, shared by all tests of one dimension
+    return origin(request.param)
+
+
+@pytest.fixture(scope="module")
+def origin_vertices(origin_poly):
+    # vertex computation on a separate origin polytope, as the vertices are
+    # stored in the polytope that computes them
+    P = origin(origin_poly.dim())
+    return P, P.vertices()
+
+
 class TestOrigin:
 
-    def test_origin_2d(self):
-        # Test 2D origin polytope
-        P = origin(2)
-        
-        # Check that it's a 2D polytope
-        assert P.dim() == 2
-        
-        # Check that it's in H-representation initially
-        assert P._isHRep
-        assert not P._isVRep
-        
-        # Check halfspace representation
-        expected_A = np.array([[1, 0], [0, 1], [-1, -1]])
-        expected_b = np.array([[0], [0], [0]])
-        assert np.array_equal(P._A, expected_A)
-        assert np.array_equal(P._b, expected_b)
-        
-        # Trigger vertex computation and check the result
-        V = P.vertices()
-        assert P._isVRep
-        assert V.shape == (2, 1)
-        assert np.allclose(V, np.array([[0], [0]]))
-
-    def test_origin_3d(self):
-        # Test 3D origin polytope
-        P = origin(3)
-        
-        # Check that it's a 3D polytope
-        assert P.dim() == 3
-        
-        # Check that it's in H-representation initially
-        assert P._isHRep
-        assert not P._isVRep
-
-        # Check halfspace representation
-        expected_A = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1], [-1, -1, -1]])
-        expected_b = np.array([[0], [0], [0], [0]])
-        assert np.array_equal(P._A, expected_A)
-        assert np.array_equal(P._b, expected_b)
-
-        # Trigger vertex computation and check the result
-        V = P.vertices()
+    def test_origin_dim(self, origin_poly, request):
+        assert origin_poly.dim() == request.node.callspec.params['origin_poly']
+
+    def test_origin_hrep_flags(self, origin_poly):
+        # H-representation initially
+        assert origin_poly._isHRep
+        assert not origin_poly._isVRep
+
+    def test_origin_A(self, origin_poly):
+        # simplex constraints
+        n = origin_poly.dim()
+        A = origin_poly._A
+        expected_A = np.vstack([np.eye(n, dtype=A.dtype), -np.ones((1, n), dtype=A.dtype)])
+        np.testing.assert_array_equal(A, expected_A, strict=True)
+
+    def test_origin_b(self, origin_poly):
+        # zero offset
+        np.testing.assert_array_equal(origin_poly._b, np.zeros((origin_poly.dim() + 1, 1)), strict=True)
+
+    def test_origin_layout(self, origin_poly):
+        # constraints are stored as C-contiguous float arrays
+        assert origin_poly._A.flags['C_CONTIGUOUS'] and origin_poly._b.flags['C_CONTIGUOUS']
+        assert origin_poly._A.dtype == np.float64 and origin_poly._b.dtype == np.float64
+
+    def test_origin_vertices_shape(self, origin_vertices):
+        P, V = origin_vertices
         assert P._isVRep
-        assert V.shape == (3, 1)
-        assert np.allclose(V, np.array([[0], [0], [0]]))
-
-    def test_origin_invalid_input(self):
-        # Test invalid input (non-positive dimension)
-        with pytest.raises(CORAerror) as excinfo:
-            origin(0)
-        assert "CORA:wrongInput" in str(excinfo.value)
-
-        with pytest.raises(CORAerror) as excinfo:
-            origin(-1)
-        assert "CORA:wrongInput" in str(excinfo.value)
-
-        with pytest.raises(CORAerror) as excinfo:
-            origin(1.5)
-        assert "CORA:wrongInput" in str(excinfo.value) 
\ No newline at end of file
+        assert V.shape == (P.dim(), 1)
+        # the vertices are stored, repeated calls do not recompute them
+        assert P.vertices() is V
+
+    def test_origin_vertices_value(self, origin_vertices):
+        # the only vertex is exactly the origin (all constraints have zero offset)
+        P, V = origin_vertices
+        np.testing.assert_array_equal(V, np.zeros((P.dim(), 1), dtype=P._A.dtype), strict=True)
+
+    def test_origin_vertices_method(self, origin_poly):
+        # the contSet wrapper passes an explicit method on to vertices_
+        P = origin(origin_poly.dim())
+        V = P.vertices('lcon2vert')
+        np.testing.assert_array_equal(V, np.zeros((P.dim(), 1)), strict=True)
+
+    @pytest.mark.parametrize("bad", [0, -1, 1.5, -0.5, 2.5, "2", None])
+    def test_origin_invalid_input(self, bad):
+        # Test invalid input (non-positive, non-integer, or non-numeric dimension)
+        # CORA:wrongValue error for the first input argument
+        with pytest.raises(CORAerror, match=r"^Wrong value for the 1st input argument") as excinfo:
+            origin(bad)
+        assert excinfo.value.identifier == 'CORA:wrongValue'
@@ -278,6 +278,44 @@ class TestPolytopeVertices:
             [1e-10, 1e-10], [1e-10, -1e-10], [-1e-10, 1e-10], [-1e-10, -1e-10]
         ]).T, atol=1e-15)
     
+    def test_vertices_cached(self):
+        """Test that the stored vertices are the true vertex set"""
+        # 2D box [-1,1] x [-2,2]
+        A = np.array([[1, 0], [-1, 0], [0, 1], [0, -1]])
+        b = np.array([1, 1, 2, 2])
+        P = Polytope(A, b)
+        V = vertices_(P)
+        V_expected = np.array([[1, 2], [1, -2], [-1, 2], [-1, -2]]).T
+        assert self._compare_vertex_sets(V, V_expected)
+        assert P._isVRep
+        assert self._compare_vertex_sets(P._V, V_expected)
+        # repeated calls return the stored vertices
+        assert vertices_(P) is P._V
+
+        # 3D box
+        A = np.vstack([np.eye(3), -np.eye(3)])
+        b = np.array([1, 2, 3, 1, 2, 3])
+        P = Polytope(A, b)
+        vertices_(P)
+        V_expected = np.array([[x, y, z] for x in (-1, 1)
+                               for y in (-2, 2) for z in (-3, 3)]).T
+        assert self._compare_vertex_sets(P._V, V_expected)
+
+    def test_vertices_unbounded_valueerror(self):
+        """Test that unbounded polytopes raise a ValueError"""
+        for A, b in ((np.array([[1]]), np.array([0])),
+                     (np.array([[1, 0], [-1, 0], [0, -1]]), np.ones(3))):
+            with pytest.raises(ValueError, match="unbounded"):
+                vertices_(Polytope(A, b))
+
+    def test_vertices_method_argument(self):
+        """Test that the method passed by the contSet wrapper is accepted"""
+        A = np.array([[1, 0], [-1, 0], [0, 1], [0, -1]])
+        P = Polytope(A, np.ones(4))
+        V = P.vertices('lcon2vert')
+        V_expected = np.array([[1, 1], [1, -1], [-1, 1], [-1, -1]]).T
+        assert self._compare_vertex_sets(V, V_expected)
+
     def _compare_vertex_sets(self, V1, V2, tol=1e-14):
         """
         Compare two sets of vertices, allowing for different ordering.
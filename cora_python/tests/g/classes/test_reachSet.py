@@ -16,6 +16,7 @@ import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 from cora_python.g.classes.reachSet import ReachSet
 from cora_python.contSet.zonotope.zonotope import Zonotope
+from cora_python.contSet.interval.interval import Interval
 
 
 class TestReachSet:
@@ -192,7 +193,35 @@ class TestReachSet:
         proj_set = R_proj.timeInterval['set'][0]
         assert isinstance(proj_set, Zonotope)
         assert proj_set.c.shape[0] == 2  # 2D after projection
-    
+
+    def test_project_numeric(self):
+        """Test project method for numeric time-point sets of mixed shapes"""
+        zono = Zonotope(np.array([1, 2, 3]), np.eye(3))
+        points = [np.arange(6.0).reshape(3, 2), np.array([4.0, 5.0, 6.0]),
+                  zono, np.arange(6.0, 12.0).reshape(3, 2)]
+        R = ReachSet({'set': points, 'time': [0.0, 0.1, 0.2, 0.3]})
+
+        R_proj = R.project([2, 0])
+
+        proj_sets = R_proj.timePoint['set']
+        assert np.array_equal(proj_sets[0], points[0][[2, 0], :])
+        assert np.array_equal(proj_sets[1], np.array([6.0, 4.0]))
+        assert isinstance(proj_sets[2], Zonotope)
+        assert np.array_equal(proj_sets[3], points[3][[2, 0], :])
+
+    def test_project_shared_sets(self):
+        """Test project method for sets shared between time points and intervals"""
+        zono = Zonotope(np.array([1, 2, 3]), np.eye(3))
+        R = ReachSet({'set': [zono, zono], 'time': [0.0, 0.1]},
+                     {'set': [zono], 'time': [[0.0, 0.1]]})
+
+        with patch.object(Zonotope, 'project', autospec=True,
+                          side_effect=lambda Z, dims: Zonotope(Z.c[dims], Z.G[dims, :])) as proj:
+            R_proj = R.project([0, 2])
+
+        assert proj.call_count == 1
+        assert np.allclose(R_proj.timeInterval['set'][0].c.flatten(), [1, 3])
+
     def test_add_method(self):
         """Test add method"""
         R1 = ReachSet({'set': [Zonotope([1, 2], np.eye(2))], 'time': [0.0]})
@@ -310,6 +339,36 @@ class TestReachSet:
         
         R_shifted = R.shiftTime(1.0)
         assert R_shifted.timePoint['time'][0] == 1.0
+
+    def test_timeStepSize_method(self):
+        """Test timeStepSize method"""
+        sets = [Zonotope([1, 2], np.eye(2))] * 3
+        R = ReachSet({'set': sets, 'time': [0.0, 0.1, 0.2]})
+        dt, uniform, hybrid = R.timeStepSize()
+        assert uniform and not hybrid
+        assert np.isclose(dt, 0.1)
+
+        R2 = ReachSet({'set': sets, 'time': [0.0, 0.1, 0.3]})
+        dt, uniform, hybrid = R2.timeStepSize()
+        assert not uniform and not hybrid
+        assert np.allclose(dt, [0.1, 0.2])
+
+        R3 = ReachSet({'set': sets, 'time': [Interval(0.0, 0.0), Interval(0.5, 0.6), Interval(1.0, 1.0)]})
+        dt, uniform, hybrid = R3.timeStepSize()
+        assert uniform and hybrid
+        assert np.isclose(dt, 0.5)
+    
+    def test_updateTime_method(self):
+        """Test updateTime method"""
+        sets = [Zonotope([1, 2], np.eye(2))] * 2
+        R = ReachSet({'set': sets, 'time': [0.1, 0.2]},
+                     {'set': sets, 'time': [Interval(0.0, 0.1), Interval(0.1, 0.2)]})
+
+        R = R.updateTime(np.array([1.0, 1.5]))
+        assert R.timePoint['time'] == [1.0, 1.5]
+        assert np.isclose(R.timeInterval['time'][0].inf, 1.0)
+        assert np.isclose(R.timeInterval['time'][0].sup, 1.1)
+        assert np.isclose(R.timeInterval['time'][1].sup, 1.6)
     
     def test_plot_method(self):
         """Test plot method"""
@@ -190,7 +190,33 @@ class TestSimResult:
         
         expected_x = [np.array([[3, 6]])]
         assert np.allclose(simRes_mult.x[0], expected_x[0])
-    
+
+    def test_scalar_multiplication_multiple_trajectories(self):
+        """Test scalar multiplication with trajectories of equal and different lengths"""
+        x = [np.array([[1, 2], [3, 4]]), np.array([[5, 6], [7, 8]])]
+        t = [np.array([[0], [0.1]]), np.array([[0], [0.2]])]
+        simRes_mult = SimResult(x, t) * np.array([1, -1])
+        assert np.allclose(simRes_mult.x[1], np.array([[5, -6], [7, -8]]))
+        assert simRes_mult.t is not t
+
+        x.append(np.array([[1, 1]]))
+        t.append(np.array([[0]]))
+        simRes_mult = 2 * SimResult(x, t)
+        assert np.allclose(simRes_mult.x[0], 2 * x[0])
+        assert np.allclose(simRes_mult.x[2], np.array([[2, 2]]))
+
+    def test_scalar_multiplication_outputs_and_algebraic(self):
+        """Test scalar multiplication of states, outputs, and algebraic variables"""
+        x = [np.array([[1, 2], [3, 4]]), np.array([[5, 6], [7, 8]])]
+        t = [np.array([[0], [0.1]]), np.array([[0], [0.2]])]
+        y = [np.array([[1], [2]]), np.array([[3], [4]])]
+        a = [np.array([[0.5, 1, 1.5], [2, 2.5, 3]])] * 2
+        simRes_mult = SimResult(x, t, 0, y, a) * 0.5
+
+        for new, old in zip(simRes_mult.x + simRes_mult.y + simRes_mult.a, x + y + a):
+            assert new.shape == old.shape
+            assert np.allclose(new, 0.5 * old)
+
     def test_scalar_multiplication_type_error(self):
         """Test scalar multiplication with invalid type"""
         simRes = SimResult([np.array([[1, 2], [3, 4]])], [np.array([0, 1])])
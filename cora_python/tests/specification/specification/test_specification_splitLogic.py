@@ -0,0 +1,49 @@
+"""
+test_specification_splitLogic - unit test for splitLogic method
+
+This test covers the partitioning of specifications into temporal logic and
+non-logic specifications.
+
+Authors: Python translation by AI Assistant
+Python translation: 2025
+"""
+
+import unittest
+import numpy as np
+from cora_python.specification.specification.specification import Specification
+from cora_python.contSet.interval.interval import Interval
+
+
+class TestSpecificationSplitLogic(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures"""
+        I = Interval(np.array([[0], [0]]), np.array([[1], [1]]))
+        self.specs = [Specification(I, 'safeSet'), Specification(I, 'unsafeSet'),
+                      Specification(I, 'safeSet'), Specification(I, 'invariant')]
+        # the stl class is not available, so temporal logic specifications
+        # are emulated via their type
+        self.specs[1].type = 'logic'
+        self.specs[3].type = 'logic'
+
+    def test_splitLogic_list(self):
+        """Test splitting a list of specifications, keeping the order"""
+        spec_non_logic, spec_logic = Specification.splitLogic(self.specs)
+
+        self.assertEqual(len(spec_non_logic), 2)
+        self.assertEqual(len(spec_logic), 2)
+        self.assertIs(spec_non_logic[0], self.specs[0])
+        self.assertIs(spec_non_logic[1], self.specs[2])
+        self.assertIs(spec_logic[0], self.specs[1])
+        self.assertIs(spec_logic[1], self.specs[3])
+
+    def test_splitLogic_single(self):
+        """Test splitting a single specification"""
+        spec_non_logic, spec_logic = self.specs[0].splitLogic()
+
+        self.assertEqual(spec_non_logic, [self.specs[0]])
+        self.assertEqual(spec_logic, [])
+
+
+if __name__ == '__main__':
+    unittest.main()